@@ -10,7 +10,8 @@ class BudgetAccountAdmin(admin.ModelAdmin):
     """Admin interface for BudgetAccount model."""
 
     list_display = ('name', 'workspace', 'default_currency', 'is_active', 'display_order', 'created_at')
-    list_filter = ('is_active', 'default_currency', 'created_at')
-    search_fields = ('name', 'description', 'workspace__name')
+    list_select_related = ('workspace',)
+    list_filter = ('is_active', 'default_currency', 'workspace', 'created_at')
+    search_fields = ('name', 'description')
     readonly_fields = ('created_at', 'updated_at')
     date_hierarchy = 'created_at'
@@ -1,19 +1,48 @@
 """Django-Ninja API endpoints for budget_accounts app."""
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import IntegrityError, transaction
+from django.db.models import F, OuterRef, Subquery
 from django.http import HttpRequest
-from ninja import Query, Router
+from django.utils import timezone
+from ninja import Body, Query, Router
 from ninja.errors import HttpError
 
 from budget_accounts.models import BudgetAccount
-from budget_accounts.schemas import BudgetAccountCreate, BudgetAccountOut, BudgetAccountUpdate
+from budget_accounts.schemas import BudgetAccountBulkList, BudgetAccountCreate, BudgetAccountOut, BudgetAccountUpdate
 from common.auth import JWTAuth
-from common.permissions import require_role
-from workspaces.models import ADMIN_ROLES
+from common.permissions import cache_workspace_role, get_current_workspace, require_role
+from workspaces.models import ADMIN_ROLES, WorkspaceMember
 
 router = Router(tags=['Budget Accounts'])
 User = get_user_model()
 
+# Columns needed to build a BudgetAccountOut response
+BUDGET_ACCOUNT_OUT_FIELDS = tuple(BudgetAccountOut.model_fields)
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def get_account_with_role(user, workspace_id: int, account_id: int, allowed_roles: list[str]) -> BudgetAccount:
+    """Fetch a workspace account together with the caller's role in one query and enforce the role."""
+    caller_role = WorkspaceMember.objects.filter(workspace_id=OuterRef('workspace_id'), user=user).values('role')[:1]
+    account = (
+        BudgetAccount.objects.only(*BUDGET_ACCOUNT_OUT_FIELDS)
+        .annotate(caller_role=Subquery(caller_role))
+        .filter(id=account_id, workspace_id=workspace_id)
+        .first()
+    )
+    if account is None:
+        require_role(user, workspace_id, allowed_roles)
+        raise HttpError(404, 'Budget account not found')
+
+    cache_workspace_role(user, workspace_id, account.caller_role)
+    require_role(user, workspace_id, allowed_roles)
+    return account
 
 
 # =============================================================================
@@ -28,115 +57,152 @@ def list_budget_accounts(
 ):
     """List all budget accounts in current workspace."""
     user = request.auth
-    workspace = user.current_workspace
-
-    if not workspace:
-        raise HttpError(404, 'No workspace selected')
+    workspace = get_current_workspace(user)
 
     queryset = BudgetAccount.objects.filter(workspace=workspace)
 
     if not include_inactive:
         queryset = queryset.filter(is_active=True)
 
-    return list(queryset.order_by('display_order', 'name'))
+    return queryset.order_by('display_order', 'name').values(*BUDGET_ACCOUNT_OUT_FIELDS)
+
+
+# Registered before the /{account_id} routes so 'bulk' is not captured as an id
+@router.post('/bulk', response={201: list[BudgetAccountOut]}, auth=JWTAuth())
+def bulk_upsert_budget_accounts(request: HttpRequest, data: BudgetAccountBulkList = Body(...)):
+    """
+    Create or update many budget accounts at once (requires owner or admin role).
+
+    Accounts are matched by name within the current workspace: new names are
+    created and existing ones are updated with batched INSERT ... ON CONFLICT.
+    If a name appears more than once in the payload, the last entry wins.
+    Payloads longer than BUDGET_ACCOUNT_BULK_MAX_ITEMS are rejected with 422.
+    """
+    user = request.auth
+    workspace = get_current_workspace(user)
+
+    require_role(user, workspace.id, ADMIN_ROLES)
+
+    # Postgres cannot update the same row twice in one statement, so dedupe by name first
+    items = {item.name: item for item in data}
+    accounts = BudgetAccount.objects.bulk_create(
+        [
+            BudgetAccount(
+                workspace=workspace,
+                name=item.name,
+                description=item.description,
+                default_currency=item.default_currency,
+                color=item.color,
+                icon=item.icon,
+                is_active=item.is_active,
+                display_order=item.display_order,
+                created_by=user,
+                updated_by=user,
+            )
+            for item in items.values()
+        ],
+        batch_size=settings.BULK_CREATE_BATCH_SIZE,
+        update_conflicts=True,
+        unique_fields=['workspace', 'name'],
+        update_fields=[
+            'description',
+            'default_currency',
+            'color',
+            'icon',
+            'is_active',
+            'display_order',
+            'updated_by',
+            'updated_at',
+        ],
+    )
+
+    # Re-read so updated rows report their original created_at
+    rows = (
+        BudgetAccount.objects.filter(id__in=[account.id for account in accounts])
+        .order_by('display_order', 'name')
+        .values(*BUDGET_ACCOUNT_OUT_FIELDS)
+    )
+    return 201, rows
 
 
 @router.get('/{account_id}', response=BudgetAccountOut, auth=JWTAuth())
 def get_budget_account(request: HttpRequest, account_id: int):
     """Get a specific budget account."""
     user = request.auth
-    workspace = user.current_workspace
+    workspace = get_current_workspace(user)
 
-    if not workspace:
-        raise HttpError(404, 'No workspace selected')
-
-    try:
-        return BudgetAccount.objects.get(id=account_id, workspace=workspace)
-    except BudgetAccount.DoesNotExist:
+    account = BudgetAccount.objects.only(*BUDGET_ACCOUNT_OUT_FIELDS).filter(id=account_id, workspace=workspace).first()
+    if account is None:
         raise HttpError(404, 'Budget account not found')
 
+    return BudgetAccountOut.model_validate(account)
+
 
 @router.post('', response={201: BudgetAccountOut, 400: dict}, auth=JWTAuth())
 def create_budget_account(request: HttpRequest, data: BudgetAccountCreate):
     """Create a new budget account (requires owner or admin role)."""
     user = request.auth
-    workspace = user.current_workspace
-
-    if not workspace:
-        raise HttpError(404, 'No workspace selected')
+    workspace = get_current_workspace(user)
 
     require_role(user, workspace.id, ADMIN_ROLES)
 
-    # Check for duplicate name
-    if BudgetAccount.objects.filter(workspace=workspace, name=data.name).exists():
+    # The (workspace, name) unique constraint rejects duplicate names
+    try:
+        with transaction.atomic():
+            account = BudgetAccount.objects.create(
+                workspace=workspace,
+                name=data.name,
+                description=data.description,
+                default_currency=data.default_currency,
+                color=data.color,
+                icon=data.icon,
+                is_active=data.is_active,
+                display_order=data.display_order,
+                created_by=user,
+                updated_by=user,
+            )
+    except IntegrityError:
         return 400, {'error': 'Budget account with this name already exists'}
 
-    account = BudgetAccount.objects.create(
-        workspace=workspace,
-        name=data.name,
-        description=data.description,
-        default_currency=data.default_currency,
-        color=data.color,
-        icon=data.icon,
-        is_active=data.is_active,
-        display_order=data.display_order,
-        created_by=user,
-        updated_by=user,
-    )
-
-    return 201, account
+    return 201, BudgetAccountOut.model_validate(account)
 
 
 @router.put('/{account_id}', response=BudgetAccountOut, auth=JWTAuth())
 def update_budget_account(request: HttpRequest, account_id: int, data: BudgetAccountUpdate):
     """Update a budget account (requires owner or admin role)."""
     user = request.auth
-    workspace = user.current_workspace
-
-    if not workspace:
-        raise HttpError(404, 'No workspace selected')
-
-    require_role(user, workspace.id, ADMIN_ROLES)
-
-    try:
-        account = BudgetAccount.objects.get(id=account_id, workspace=workspace)
-    except BudgetAccount.DoesNotExist:
-        raise HttpError(404, 'Budget account not found')
+    workspace = get_current_workspace(user)
 
-    # Check for name conflict if name is being updated
-    if data.name is not None and data.name != account.name:
-        if BudgetAccount.objects.filter(workspace=workspace, name=data.name).exclude(id=account_id).exists():
-            raise HttpError(400, 'Budget account with this name already exists')
+    account = get_account_with_role(user, workspace.id, account_id, ADMIN_ROLES)
 
-    # Update fields
-    update_data = data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(account, field, value)
+    # Update only the fields sent in the request; all schema fields are scalars, so no dump is needed
+    changed_fields = data.model_fields_set
+    for field in changed_fields:
+        setattr(account, field, getattr(data, field))
 
     account.updated_by = user
-    account.save()
+    # The (workspace, name) unique constraint rejects renames to an existing name
+    try:
+        with transaction.atomic():
+            account.save(update_fields=[*changed_fields, 'updated_by', 'updated_at'])
+    except IntegrityError:
+        raise HttpError(400, 'Budget account with this name already exists')
 
-    return account
+    return BudgetAccountOut.model_validate(account)
 
 
 @router.delete('/{account_id}', response={204: None}, auth=JWTAuth())
 def delete_budget_account(request: HttpRequest, account_id: int):
     """Delete a budget account (requires owner or admin role)."""
     user = request.auth
-    workspace = user.current_workspace
-
-    if not workspace:
-        raise HttpError(404, 'No workspace selected')
+    workspace = get_current_workspace(user)
 
     require_role(user, workspace.id, ADMIN_ROLES)
 
-    try:
-        account = BudgetAccount.objects.get(id=account_id, workspace=workspace)
-    except BudgetAccount.DoesNotExist:
+    deleted, _ = BudgetAccount.objects.filter(id=account_id, workspace=workspace).delete()
+    if not deleted:
         raise HttpError(404, 'Budget account not found')
 
-    account.delete()
-
     return 204, None
 
 
@@ -144,20 +210,15 @@ def delete_budget_account(request: HttpRequest, account_id: int):
 def toggle_archive_budget_account(request: HttpRequest, account_id: int):
     """Archive/unarchive a budget account (toggle is_active)."""
     user = request.auth
-    workspace = user.current_workspace
+    workspace = get_current_workspace(user)
 
-    if not workspace:
-        raise HttpError(404, 'No workspace selected')
+    account = get_account_with_role(user, workspace.id, account_id, ADMIN_ROLES)
 
-    require_role(user, workspace.id, ADMIN_ROLES)
-
-    try:
-        account = BudgetAccount.objects.get(id=account_id, workspace=workspace)
-    except BudgetAccount.DoesNotExist:
-        raise HttpError(404, 'Budget account not found')
-
-    account.is_active = not account.is_active
-    account.updated_by = user
-    account.save()
+    # Flip the flag in SQL so concurrent toggles cannot overwrite each other
+    BudgetAccount.objects.filter(id=account.id).update(
+        is_active=~F('is_active'), updated_by=user, updated_at=timezone.now()
+    )
+    # Report the flag the UPDATE actually wrote, not a flip of the value read earlier
+    account.refresh_from_db(fields=['is_active', 'updated_at'])
 
-    return account
+    return BudgetAccountOut.model_validate(account)
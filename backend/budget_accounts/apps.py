@@ -4,7 +4,3 @@ from django.apps import AppConfig
 class BudgetAccountsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'budget_accounts'
-
-    def ready(self):
-        """Import API module when app is ready."""
-        import budget_accounts.api  # noqa: F401
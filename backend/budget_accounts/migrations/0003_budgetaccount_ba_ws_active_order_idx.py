@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget_accounts', '0002_initial'),
+        ('workspaces', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budgetaccount',
+            index=models.Index(fields=['workspace', 'is_active', 'display_order', 'name'], name='ba_ws_active_order_idx'),
+        ),
+    ]
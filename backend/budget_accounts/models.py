@@ -33,6 +33,9 @@ class BudgetAccount(models.Model):
     class Meta:
         db_table = 'budget_accounts'
         unique_together = [['workspace', 'name']]
+        indexes = [
+            models.Index(fields=['workspace', 'is_active', 'display_order', 'name'], name='ba_ws_active_order_idx'),
+        ]
 
     def __str__(self):
         return f'{self.workspace.name} - {self.name}'
@@ -1,28 +1,38 @@
 """Pydantic schemas for budget_accounts API."""
 
 from datetime import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, Field
 
+# ISO 4217 style code, kept as a pattern so it is published in the OpenAPI schema the frontend reads
+CurrencyCode = Annotated[str, Field(pattern='^[A-Z]{3}$')]
+
 
 class BudgetAccountCreate(BaseModel):
     """Schema for creating a budget account."""
 
     name: str = Field(max_length=100)
     description: str | None = None
-    default_currency: str = Field(default='PLN', pattern='^[A-Z]{3}$')
+    default_currency: CurrencyCode = 'PLN'
     color: str | None = Field(None, max_length=7)
     icon: str | None = Field(None, max_length=50)
     is_active: bool = True
     display_order: int = 0
 
 
+# Upper bound on one bulk upsert payload, so a single request cannot send an unbounded INSERT
+BUDGET_ACCOUNT_BULK_MAX_ITEMS = 500
+
+BudgetAccountBulkList = Annotated[list[BudgetAccountCreate], Field(max_length=BUDGET_ACCOUNT_BULK_MAX_ITEMS)]
+
+
 class BudgetAccountUpdate(BaseModel):
     """Schema for updating a budget account."""
 
     name: str | None = Field(None, max_length=100)
     description: str | None = None
-    default_currency: str | None = Field(None, pattern='^[A-Z]{3}$')
+    default_currency: CurrencyCode | None = None
     color: str | None = Field(None, max_length=7)
     icon: str | None = Field(None, max_length=50)
     is_active: bool | None = None
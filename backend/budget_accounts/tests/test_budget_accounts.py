@@ -4,8 +4,9 @@ from django.contrib.auth import get_user_model
 from django.test import TestCase
 
 from budget_accounts.models import BudgetAccount
+from budget_accounts.schemas import BUDGET_ACCOUNT_BULK_MAX_ITEMS
 from common.tests.mixins import APIClientMixin, AuthMixin
-from workspaces.models import WorkspaceMember
+from workspaces.models import Workspace, WorkspaceMember
 
 User = get_user_model()
 
@@ -21,7 +22,6 @@ class BudgetAccountTestCase(APIClientMixin, AuthMixin, TestCase):
     def setUp(self):
         """Set up authenticated user."""
         APIClientMixin.setUp(self)
-        AuthMixin.setUp(self)
 
     def create_budget_account(self, **kwargs):
         """Helper to create a budget account."""
@@ -133,8 +133,6 @@ class TestGetBudgetAccount(BudgetAccountTestCase):
 
     def test_get_account_from_other_workspace(self):
         """Test getting account from another workspace returns 404."""
-        from workspaces.models import Workspace
-
         # Create another workspace with account
         other_workspace = Workspace.objects.create(name='Other Workspace')
         other_user = User.objects.create_user(
@@ -226,6 +224,20 @@ class TestCreateBudgetAccount(BudgetAccountTestCase):
         self.assertStatus(400)
         self.assertIn('already exists', data['error'].lower())
 
+    def test_create_invalid_currency_returns_error(self):
+        """Test creating account with a malformed currency code is rejected."""
+        self.post(
+            '/api/budget-accounts',
+            {
+                'name': 'Bad Currency',
+                'default_currency': 'usd',
+            },
+            **self.auth_headers(),
+        )
+
+        self.assertStatus(422)
+        self.assertFalse(BudgetAccount.objects.filter(name='Bad Currency').exists())
+
     def test_create_requires_owner_or_admin_role(self):
         """Test creating account requires owner or admin role."""
         # Change user to viewer
@@ -287,6 +299,83 @@ class TestCreateBudgetAccount(BudgetAccountTestCase):
         self.assertStatus(401)
 
 
+# =============================================================================
+# Bulk Upsert Budget Accounts
+# =============================================================================
+
+
+class TestBulkUpsertBudgetAccounts(BudgetAccountTestCase):
+    """Tests for POST /backend/budget-accounts/bulk."""
+
+    def test_bulk_creates_new_accounts(self):
+        """Test bulk upsert creates accounts that do not exist yet."""
+        data = self.post(
+            '/api/budget-accounts/bulk',
+            [
+                {'name': 'Savings', 'default_currency': 'USD'},
+                {'name': 'Business', 'display_order': 2},
+            ],
+            **self.auth_headers(),
+        )
+
+        self.assertStatus(201)
+        self.assertEqual({acc['name'] for acc in data}, {'Savings', 'Business'})
+        savings = BudgetAccount.objects.get(workspace=self.workspace, name='Savings')
+        self.assertEqual(savings.default_currency, 'USD')
+        self.assertEqual(savings.created_by, self.user)
+
+    def test_bulk_updates_existing_accounts_by_name(self):
+        """Test bulk upsert updates accounts matched by name instead of duplicating them."""
+        account = self.create_budget_account(name='Existing', description='Old', display_order=1)
+
+        data = self.post(
+            '/api/budget-accounts/bulk',
+            [{'name': 'Existing', 'description': 'New', 'display_order': 5}],
+            **self.auth_headers(),
+        )
+
+        self.assertStatus(201)
+        self.assertEqual(data[0]['id'], account.id)
+        self.assertEqual(BudgetAccount.objects.filter(workspace=self.workspace, name='Existing').count(), 1)
+        account.refresh_from_db()
+        self.assertEqual(account.description, 'New')
+        self.assertEqual(account.display_order, 5)
+        self.assertEqual(account.updated_by, self.user)
+
+    def test_bulk_duplicate_names_in_payload_last_wins(self):
+        """Test duplicate names within one payload collapse to the last entry."""
+        data = self.post(
+            '/api/budget-accounts/bulk',
+            [
+                {'name': 'Twice', 'description': 'First'},
+                {'name': 'Twice', 'description': 'Second'},
+            ],
+            **self.auth_headers(),
+        )
+
+        self.assertStatus(201)
+        self.assertEqual(len(data), 1)
+        self.assertEqual(data[0]['description'], 'Second')
+
+    def test_bulk_requires_owner_or_admin_role(self):
+        """Test bulk upsert requires owner or admin role."""
+        WorkspaceMember.objects.filter(workspace=self.workspace, user=self.user).update(role='member')
+
+        self.post('/api/budget-accounts/bulk', [{'name': 'Should Fail'}], **self.auth_headers())
+
+        self.assertStatus(403)
+        self.assertFalse(BudgetAccount.objects.filter(name='Should Fail').exists())
+
+    def test_bulk_rejects_payload_over_limit(self):
+        """Test bulk upsert rejects payloads longer than the item cap without writing anything."""
+        payload = [{'name': f'Account {i}'} for i in range(BUDGET_ACCOUNT_BULK_MAX_ITEMS + 1)]
+
+        self.post('/api/budget-accounts/bulk', payload, **self.auth_headers())
+
+        self.assertStatus(422)
+        self.assertFalse(BudgetAccount.objects.filter(name__startswith='Account ').exists())
+
+
 # =============================================================================
 # Update Budget Account
 # =============================================================================
@@ -355,6 +444,30 @@ class TestUpdateBudgetAccount(BudgetAccountTestCase):
 
         self.assertStatus(400)
 
+    def test_create_and_update_reject_same_invalid_currencies(self):
+        """Test create and update share the currency check: lowercase, short and long codes are rejected."""
+        account = self.create_budget_account(name='Currency Check')
+
+        for currency in ('usd', 'Usd', 'US', 'USDX'):
+            with self.subTest(currency=currency):
+                self.post(
+                    '/api/budget-accounts',
+                    {'name': f'Bad {currency}', 'default_currency': currency},
+                    **self.auth_headers(),
+                )
+                self.assertStatus(422)
+
+                self.put(
+                    f'/api/budget-accounts/{account.id}',
+                    {'default_currency': currency},
+                    **self.auth_headers(),
+                )
+                self.assertStatus(422)
+
+        account.refresh_from_db()
+        self.assertEqual(account.default_currency, 'PLN')
+        self.assertFalse(BudgetAccount.objects.filter(name__startswith='Bad ').exists())
+
     def test_update_account_not_found(self):
         """Test updating non-existent account returns 404."""
         fake_id = 999999
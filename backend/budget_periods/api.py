@@ -1,10 +1,14 @@
 """Django-Ninja API endpoints for budget periods."""
 
+from collections.abc import Iterable, Iterator
 from datetime import date
+from itertools import batched
 from typing import Optional
 
 from dateutil.relativedelta import relativedelta
+from django.conf import settings
 from django.db import transaction
+from django.db.models import Exists, Prefetch, Subquery
 from ninja import Query, Router
 
 from budget_accounts.models import BudgetAccount
@@ -17,31 +21,72 @@ from budget_periods.schemas import (
 )
 from budgets.models import Budget
 from categories.models import Category
-from common.auth import JWTAuth
-from common.permissions import require_role
+from common.auth import AsyncJWTAuth, JWTAuth
+from common.permissions import cache_workspace_role, require_role
 from core.schemas import DetailOut
 from period_balances.models import PeriodBalance
 from planned_transactions.models import PlannedTransaction
-from workspaces.models import WRITE_ROLES
+from workspaces.models import WRITE_ROLES, WorkspaceMember
 
 router = Router(tags=['Budget Periods'])
 
+# Columns needed to build a BudgetPeriodOut response (user fields read their raw FK columns)
+BUDGET_PERIOD_OUT_FIELDS = tuple(field.validation_alias or name for name, field in BudgetPeriodOut.model_fields.items())
+
+# Currencies every new period starts with a balance row for
+DEFAULT_CURRENCIES = ('PLN', 'USD', 'EUR', 'UAH')
+ZERO_BALANCE_FIELDS = {
+    'opening_balance': 0,
+    'total_income': 0,
+    'total_expenses': 0,
+    'exchanges_in': 0,
+    'exchanges_out': 0,
+    'closing_balance': 0,
+}
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 
-def get_workspace_period(period_id: int, workspace_id: int) -> BudgetPeriod:
-    """Helper to get a period and verify it belongs to the current workspace."""
-    period = (
-        BudgetPeriod.objects.select_related('budget_account')
-        .filter(id=period_id, budget_account__workspace_id=workspace_id)
-        .first()
+def caller_role_subquery(user, workspace_id: int) -> Subquery:
+    """Subquery for the caller's workspace role, so it can ride along on another lookup."""
+    return Subquery(WorkspaceMember.objects.filter(workspace_id=workspace_id, user=user).values('role')[:1])
+
+
+def create_period_balances(period: BudgetPeriod) -> None:
+    """Create zeroed period balances for every default currency."""
+    PeriodBalance.objects.bulk_create(
+        [
+            PeriodBalance(budget_period=period, currency=currency, **ZERO_BALANCE_FIELDS)
+            for currency in DEFAULT_CURRENCIES
+        ],
+        batch_size=settings.BULK_CREATE_BATCH_SIZE,
     )
-    if not period:
-        return None
-    return period
+
+
+def build_planned_transaction_copies(
+    source_planned_transactions: Iterable[PlannedTransaction],
+    new_period: BudgetPeriod,
+    category_mapping: dict[int, int],
+    date_offset: relativedelta,
+    user,
+) -> Iterator[PlannedTransaction]:
+    """Yield pending copies of planned transactions for new_period, shifted by date_offset."""
+    for source_planned in source_planned_transactions:
+        yield PlannedTransaction(
+            budget_period=new_period,
+            name=source_planned.name,
+            amount=source_planned.amount,
+            currency=source_planned.currency,
+            category_id=category_mapping.get(source_planned.category_id),
+            planned_date=source_planned.planned_date + date_offset,
+            payment_date=None,
+            status='pending',
+            transaction_id=None,
+            created_by=user,
+        )
 
 
 # =============================================================================
@@ -49,37 +94,41 @@ def get_workspace_period(period_id: int, workspace_id: int) -> BudgetPeriod:
 # =============================================================================
 
 
-@router.get('', response=list[BudgetPeriodOut], auth=JWTAuth())
-def list_periods(request, budget_account_id: Optional[int] = Query(None)):
+@router.get('', response=list[BudgetPeriodOut], auth=AsyncJWTAuth())
+async def list_periods(request, budget_account_id: Optional[int] = Query(None)):
     """List budget periods for the current workspace, optionally filtered by budget account."""
     workspace = request.auth.current_workspace
-    queryset = BudgetPeriod.objects.select_related('budget_account').filter(budget_account__workspace_id=workspace.id)
+    queryset = BudgetPeriod.objects.filter(budget_account__workspace_id=workspace.id)
 
     if budget_account_id:
         queryset = queryset.filter(budget_account_id=budget_account_id)
 
-    return list(queryset.order_by('-start_date'))
+    return [row async for row in queryset.order_by('-start_date').values(*BUDGET_PERIOD_OUT_FIELDS)]
 
 
-@router.get('/current', response={200: BudgetPeriodOut, 404: DetailOut}, auth=JWTAuth())
-def get_current_period(request, current_date: date):
+@router.get('/current', response={200: BudgetPeriodOut, 404: DetailOut}, auth=AsyncJWTAuth())
+async def get_current_period(request, current_date: date):
     """Get the budget period containing the given date for the current workspace."""
     workspace = request.auth.current_workspace
-    period = (
-        BudgetPeriod.objects.select_related('budget_account')
-        .filter(budget_account__workspace_id=workspace.id, start_date__lte=current_date, end_date__gte=current_date)
-        .first()
+    period = await (
+        BudgetPeriod.objects.only(*BUDGET_PERIOD_OUT_FIELDS)
+        .filter(budget_account__workspace_id=workspace.id, date_range__contains=current_date)
+        .afirst()
     )
     if not period:
         return 404, {'detail': 'No budget period found for the given date'}
     return 200, period
 
 
-@router.get('{period_id}', response={200: BudgetPeriodOut, 404: DetailOut}, auth=JWTAuth())
-def get_period(request, period_id: int):
+@router.get('{period_id}', response={200: BudgetPeriodOut, 404: DetailOut}, auth=AsyncJWTAuth())
+async def get_period(request, period_id: int):
     """Get a specific budget period by ID."""
     workspace = request.auth.current_workspace
-    period = get_workspace_period(period_id, workspace.id)
+    period = await (
+        BudgetPeriod.objects.only(*BUDGET_PERIOD_OUT_FIELDS)
+        .filter(id=period_id, budget_account__workspace_id=workspace.id)
+        .afirst()
+    )
     if not period:
         return 404, {'detail': 'Period not found'}
     return 200, period
@@ -91,11 +140,19 @@ def create_period(request, data: BudgetPeriodCreate):
     user = request.auth
     workspace = user.current_workspace
 
+    # Verify the budget account belongs to the current workspace, resolving the caller's role in the same query
+    budget_account = (
+        BudgetAccount.objects.only('id')
+        .annotate(caller_role=caller_role_subquery(user, workspace.id))
+        .filter(id=data.budget_account_id, workspace_id=workspace.id)
+        .first()
+    )
+    if budget_account is not None:
+        cache_workspace_role(user, workspace.id, budget_account.caller_role)
+
     require_role(user, workspace.id, WRITE_ROLES)
 
-    # Verify the budget account belongs to the current workspace
-    budget_account = BudgetAccount.objects.filter(id=data.budget_account_id, workspace_id=workspace.id).first()
-    if not budget_account:
+    if budget_account is None:
         return 404, {'detail': 'Budget account not found in current workspace'}
 
     with transaction.atomic():
@@ -110,56 +167,53 @@ def create_period(request, data: BudgetPeriodCreate):
         )
 
         # Automatically create period balances for all currencies
-        currencies = ['PLN', 'USD', 'EUR', 'UAH']
-        PeriodBalance.objects.bulk_create(
-            [
-                PeriodBalance(
-                    budget_period=period,
-                    currency=currency,
-                    opening_balance=0,
-                    total_income=0,
-                    total_expenses=0,
-                    exchanges_in=0,
-                    exchanges_out=0,
-                    closing_balance=0,
-                )
-                for currency in currencies
-            ]
-        )
+        create_period_balances(period)
 
     return 201, period
 
 
-@router.put('{period_id}', response={200: BudgetPeriodOut, 404: DetailOut}, auth=JWTAuth())
+@router.put('{period_id}', response={200: BudgetPeriodOut, 400: DetailOut, 404: DetailOut}, auth=JWTAuth())
 def update_period(request, period_id: int, data: BudgetPeriodUpdate):
     """Update a budget period."""
     user = request.auth
     workspace = user.current_workspace
 
+    # Fetch the period, the caller's role and (if requested) the target account check in one query
+    lookup = BudgetPeriod.objects.annotate(caller_role=caller_role_subquery(user, workspace.id))
+    if data.budget_account_id is not None:
+        target_account = BudgetAccount.objects.filter(id=data.budget_account_id, workspace_id=workspace.id)
+        lookup = lookup.annotate(target_account_exists=Exists(target_account))
+    period = lookup.filter(id=period_id, budget_account__workspace_id=workspace.id).first()
+    if period is not None:
+        cache_workspace_role(user, workspace.id, period.caller_role)
+
     require_role(user, workspace.id, WRITE_ROLES)
 
-    period = get_workspace_period(period_id, workspace.id)
     if not period:
         return 404, {'detail': 'Period not found'}
 
+    changed_fields = []
+
     # If budget_account_id is being changed, verify the new account belongs to workspace
     if data.budget_account_id is not None and data.budget_account_id != period.budget_account_id:
-        new_account = BudgetAccount.objects.filter(id=data.budget_account_id, workspace_id=workspace.id).first()
-        if not new_account:
+        if not period.target_account_exists:
             return 404, {'detail': 'Budget account not found in current workspace'}
         period.budget_account_id = data.budget_account_id
+        changed_fields.append('budget_account')
 
-    if data.name is not None:
-        period.name = data.name
-    if data.start_date is not None:
-        period.start_date = data.start_date
-    if data.end_date is not None:
-        period.end_date = data.end_date
-    if data.weeks is not None:
-        period.weeks = data.weeks
+    for field in ('name', 'start_date', 'end_date', 'weeks'):
+        value = getattr(data, field)
+        if value is not None:
+            setattr(period, field, value)
+            changed_fields.append(field)
+
+    # A partial update can still invert the stored range, which Postgres rejects when building date_range
+    if period.end_date < period.start_date:
+        return 400, {'detail': 'end_date must be on or after start_date'}
 
     period.updated_by = user
-    period.save()
+    # Write only the columns that changed instead of the whole row
+    period.save(update_fields=[*changed_fields, 'updated_by', 'updated_at'])
 
     return 200, period
 
@@ -172,11 +226,10 @@ def delete_period(request, period_id: int):
 
     require_role(user, workspace.id, WRITE_ROLES)
 
-    period = get_workspace_period(period_id, workspace.id)
-    if not period:
+    deleted, _ = BudgetPeriod.objects.filter(id=period_id, budget_account__workspace_id=workspace.id).delete()
+    if not deleted:
         return 404, {'detail': 'Period not found'}
 
-    period.delete()
     return 204, None
 
 
@@ -191,8 +244,14 @@ def copy_period(request, period_id: int, data: BudgetPeriodCopy):
 
     require_role(user, workspace.id, WRITE_ROLES)
 
-    # Get source period and verify it belongs to current workspace
-    source_period = get_workspace_period(period_id, workspace.id)
+    # Get source period and verify it belongs to current workspace, loading only the child columns the copy reads
+    source_period = (
+        BudgetPeriod.objects.prefetch_related(
+            Prefetch('categories', queryset=Category.objects.only('id', 'budget_period', 'name'))
+        )
+        .filter(id=period_id, budget_account__workspace_id=workspace.id)
+        .first()
+    )
     if not source_period:
         return 404, {'detail': 'Period not found'}
 
@@ -209,77 +268,50 @@ def copy_period(request, period_id: int, data: BudgetPeriodCopy):
         )
 
         # Create period balances for all currencies
-        currencies = ['PLN', 'USD', 'EUR', 'UAH']
-        PeriodBalance.objects.bulk_create(
-            [
-                PeriodBalance(
-                    budget_period=new_period,
-                    currency=currency,
-                    opening_balance=0,
-                    total_income=0,
-                    total_expenses=0,
-                    exchanges_in=0,
-                    exchanges_out=0,
-                    closing_balance=0,
-                )
-                for currency in currencies
-            ]
-        )
+        create_period_balances(new_period)
 
         # Calculate date offset between periods
         date_offset = relativedelta(new_period.start_date, source_period.start_date)
 
-        # Copy categories and keep mapping
-        category_mapping = {}  # old_id -> new_category
-        for source_category in source_period.categories.all():
-            new_category = Category.objects.create(
-                budget_period=new_period,
-                name=source_category.name,
-                created_by=user,
-            )
-            category_mapping[source_category.id] = new_category
-
-        # Copy budgets
+        # Copy categories and keep mapping (Postgres returns the new PKs from bulk_create)
+        source_categories = list(source_period.categories.all())
+        new_categories = Category.objects.bulk_create(
+            [
+                Category(budget_period=new_period, name=source_category.name, created_by=user)
+                for source_category in source_categories
+            ],
+            batch_size=settings.BULK_CREATE_BATCH_SIZE,
+        )
+        category_mapping = {  # old_id -> new_id
+            source_category.id: new_category.id
+            for source_category, new_category in zip(source_categories, new_categories)
+        }
+
+        # Copy budgets straight from their column values, without hydrating the source rows
         Budget.objects.bulk_create(
             [
                 Budget(
                     budget_period=new_period,
-                    category_id=category_mapping[source_budget.category_id].id,
-                    currency=source_budget.currency,
-                    amount=source_budget.amount,
+                    category_id=category_mapping[category_id],
+                    currency=currency,
+                    amount=amount,
                 )
-                for source_budget in source_period.budgets.all()
-                if source_budget.category_id in category_mapping
-            ]
-        )
-
-        # Copy planned transactions with adjusted dates and status
-        planned_transactions_to_create = []
-        for source_planned in source_period.planned_transactions.all():
-            new_category_id = None
-            if source_planned.category_id:
-                new_category = category_mapping.get(source_planned.category_id)
-                if new_category:
-                    new_category_id = new_category.id
-
-            # Adjust the planned date
-            new_planned_date = source_planned.planned_date + date_offset
-
-            planned_transactions_to_create.append(
-                PlannedTransaction(
-                    budget_period=new_period,
-                    name=source_planned.name,
-                    amount=source_planned.amount,
-                    currency=source_planned.currency,
-                    category_id=new_category_id,
-                    planned_date=new_planned_date,
-                    payment_date=None,
-                    status='pending',
-                    transaction_id=None,
-                    created_by=user,
+                for category_id, currency, amount in source_period.budgets.values_list(
+                    'category_id', 'currency', 'amount'
                 )
-            )
+                if category_id in category_mapping
+            ],
+            batch_size=settings.BULK_CREATE_BATCH_SIZE,
+        )
 
-        PlannedTransaction.objects.bulk_create(planned_transactions_to_create)
+        # Copy planned transactions with adjusted dates and status, streaming one batch at a time
+        source_planned_transactions = source_period.planned_transactions.only(
+            'name', 'amount', 'currency', 'category', 'planned_date'
+        ).iterator(chunk_size=settings.BULK_CREATE_BATCH_SIZE)
+        planned_copies = build_planned_transaction_copies(
+            source_planned_transactions, new_period, category_mapping, date_offset, user
+        )
+        for batch in batched(planned_copies, settings.BULK_CREATE_BATCH_SIZE):
+            PlannedTransaction.objects.bulk_create(batch)
 
     return 201, new_period
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget_periods', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='budgetperiod',
+            index=models.Index(fields=['budget_account', '-start_date'], name='bp_account_start_desc_idx'),
+        ),
+    ]
@@ -0,0 +1,27 @@
+import django.contrib.postgres.fields.ranges
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budget_periods', '0003_budgetperiod_bp_account_start_desc_idx'),
+    ]
+
+    operations = [
+        # daterange() rejects an upper bound below the lower one, so swap any inverted rows before adding the column
+        migrations.RunSQL(
+            'UPDATE budget_periods SET start_date = end_date, end_date = start_date WHERE end_date < start_date',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddField(
+            model_name='budgetperiod',
+            name='date_range',
+            field=models.GeneratedField(db_persist=True, expression=models.Func(models.F('start_date'), models.F('end_date'), models.Value('[]'), function='daterange', output_field=django.contrib.postgres.fields.ranges.DateRangeField()), output_field=django.contrib.postgres.fields.ranges.DateRangeField()),
+        ),
+        migrations.AddIndex(
+            model_name='budgetperiod',
+            index=django.contrib.postgres.indexes.GistIndex(fields=['date_range'], name='bp_date_range_gist_idx'),
+        ),
+    ]
@@ -1,4 +1,6 @@
 from django.conf import settings
+from django.contrib.postgres.fields import DateRangeField
+from django.contrib.postgres.indexes import GistIndex
 from django.db import models
 
 
@@ -12,6 +14,18 @@ class BudgetPeriod(models.Model):
     start_date = models.DateField()
     end_date = models.DateField()
     weeks = models.IntegerField(blank=True, null=True)
+    # Inclusive [start_date, end_date] range kept by Postgres, so "period contains date" is one GiST probe
+    date_range = models.GeneratedField(
+        expression=models.Func(
+            models.F('start_date'),
+            models.F('end_date'),
+            models.Value('[]'),
+            function='daterange',
+            output_field=DateRangeField(),
+        ),
+        output_field=DateRangeField(),
+        db_persist=True,
+    )
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.SET_NULL,
@@ -31,6 +45,10 @@ class BudgetPeriod(models.Model):
 
     class Meta:
         db_table = 'budget_periods'
+        indexes = [
+            models.Index(fields=['budget_account', '-start_date'], name='bp_account_start_desc_idx'),
+            GistIndex(fields=['date_range'], name='bp_date_range_gist_idx'),
+        ]
 
     def __str__(self):
         return f'{self.budget_account.name} - {self.name}'
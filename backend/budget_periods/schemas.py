@@ -1,7 +1,7 @@
 """Pydantic schemas for budget periods API."""
 
 from datetime import date, datetime
-from typing import Any, Optional
+from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
@@ -28,14 +28,9 @@ class BudgetPeriodCreate(BudgetPeriodBase):
     budget_account_id: int
 
 
-class BudgetPeriodCopy(BaseModel):
+class BudgetPeriodCopy(BudgetPeriodBase):
     """Schema for copying a budget period."""
 
-    name: str = Field(..., max_length=100)
-    start_date: date
-    end_date: date
-    weeks: Optional[int] = None
-
 
 class BudgetPeriodUpdate(BaseModel):
     """Schema for updating a budget period."""
@@ -46,15 +41,20 @@ class BudgetPeriodUpdate(BaseModel):
     weeks: Optional[int] = None
     budget_account_id: Optional[int] = None
 
+    @field_validator('end_date')
+    @classmethod
+    def end_date_after_start_date(cls, v, info):
+        # Partial updates are checked against the stored dates in the endpoint
+        start_date = info.data.get('start_date')
+        if v is not None and start_date is not None and v < start_date:
+            raise ValueError('end_date must be on or after start_date')
+        return v
+
 
 class BudgetPeriodOut(BaseModel):
     """Schema for budget period response."""
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        # Use arbitrary_types_allowed to accept User objects
-        arbitrary_types_allowed=True,
-    )
+    model_config = ConfigDict(from_attributes=True)
 
     id: int
     budget_account_id: int
@@ -62,18 +62,7 @@ class BudgetPeriodOut(BaseModel):
     start_date: date
     end_date: date
     weeks: Optional[int] = None
-    created_by: Optional[int] = None
-    updated_by: Optional[int] = None
+    # Read the raw FK columns so serializing a period never lazy-loads its users
+    created_by: Optional[int] = Field(None, validation_alias='created_by_id')
+    updated_by: Optional[int] = Field(None, validation_alias='updated_by_id')
     created_at: datetime
-
-    @field_validator('created_by', 'updated_by', mode='before')
-    @classmethod
-    def validate_user_id(cls, value: Any) -> Optional[int]:
-        """Extract user ID from Django User ForeignKey field."""
-        if value is None:
-            return None
-        if hasattr(value, 'id'):
-            return value.id
-        if isinstance(value, int):
-            return value
-        return None
@@ -17,18 +17,19 @@ from workspaces.models import WorkspaceMember
 class BudgetPeriodsTestCase(AuthMixin, APIClientMixin, TestCase):
     """Base test case for budget periods tests with common setup."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up authenticated user and create additional budget account for testing."""
-        super().setUp()
+        super().setUpTestData()
         # Create an additional budget account for testing
-        self.secondary_account = BudgetAccount.objects.create(
-            workspace=self.workspace,
+        cls.secondary_account = BudgetAccount.objects.create(
+            workspace=cls.workspace,
             name='Secondary Account',
             description='Secondary budget account for testing',
             default_currency='USD',
             is_active=True,
             display_order=1,
-            created_by=self.user,
+            created_by=cls.user,
         )
 
 
@@ -49,7 +50,7 @@ class TestListPeriods(BudgetPeriodsTestCase):
         """Test listing returns all periods in workspace."""
         # Create periods in the user's workspace
         BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Period 1',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -71,7 +72,7 @@ class TestListPeriods(BudgetPeriodsTestCase):
     def test_list_periods_ordered_by_start_date_desc(self):
         """Test periods are ordered by start_date descending."""
         BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='January',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -114,7 +115,7 @@ class TestGetCurrentPeriod(BudgetPeriodsTestCase):
     def test_get_current_period_found(self):
         """Test getting current period when it exists."""
         BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='January 2025',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -128,7 +129,7 @@ class TestGetCurrentPeriod(BudgetPeriodsTestCase):
     def test_get_current_period_on_boundary(self):
         """Test getting period on start date boundary."""
         BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='January 2025',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -160,7 +161,7 @@ class TestGetPeriod(BudgetPeriodsTestCase):
     def test_get_period_by_id(self):
         """Test getting a period by ID."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -179,7 +180,7 @@ class TestGetPeriod(BudgetPeriodsTestCase):
     def test_get_period_requires_auth(self):
         """Test getting a period requires authentication."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -199,7 +200,7 @@ class TestCreatePeriod(BudgetPeriodsTestCase):
 
     def test_create_period_success(self):
         """Test successful period creation."""
-        account = self.workspace.budget_accounts.first()
+        account = self.budget_account
         data = self.post(
             '/api/budget-periods',
             {
@@ -217,7 +218,7 @@ class TestCreatePeriod(BudgetPeriodsTestCase):
 
     def test_create_period_creates_balances(self):
         """Test that creating a period creates balances for all currencies."""
-        account = self.workspace.budget_accounts.first()
+        account = self.budget_account
         self.post(
             '/api/budget-periods',
             {
@@ -252,7 +253,7 @@ class TestCreatePeriod(BudgetPeriodsTestCase):
 
     def test_create_period_without_weeks(self):
         """Test creating period without weeks field."""
-        account = self.workspace.budget_accounts.first()
+        account = self.budget_account
         data = self.post(
             '/api/budget-periods',
             {
@@ -268,7 +269,7 @@ class TestCreatePeriod(BudgetPeriodsTestCase):
 
     def test_create_period_requires_auth(self):
         """Test creating period requires authentication."""
-        account = self.workspace.budget_accounts.first()
+        account = self.budget_account
         self.post(
             '/api/budget-periods',
             {
@@ -283,7 +284,7 @@ class TestCreatePeriod(BudgetPeriodsTestCase):
     def test_viewer_cannot_create_period(self):
         """Test that a viewer cannot create a period."""
         WorkspaceMember.objects.filter(user=self.user).update(role='viewer')
-        account = self.workspace.budget_accounts.first()
+        account = self.budget_account
         self.post(
             '/api/budget-periods',
             {
@@ -296,10 +297,25 @@ class TestCreatePeriod(BudgetPeriodsTestCase):
         )
         self.assertStatus(403)
 
+    def test_viewer_gets_403_for_missing_account(self):
+        """Test that the role check still wins over a missing budget account."""
+        WorkspaceMember.objects.filter(user=self.user).update(role='viewer')
+        self.post(
+            '/api/budget-periods',
+            {
+                'budget_account_id': 99999,
+                'name': 'March 2025',
+                'start_date': '2025-03-01',
+                'end_date': '2025-03-31',
+            },
+            **self.auth_headers(),
+        )
+        self.assertStatus(403)
+
     def test_member_can_create_period(self):
         """Test that a member can create a period."""
         WorkspaceMember.objects.filter(user=self.user).update(role='member')
-        account = self.workspace.budget_accounts.first()
+        account = self.budget_account
         self.post(
             '/api/budget-periods',
             {
@@ -324,7 +340,7 @@ class TestUpdatePeriod(BudgetPeriodsTestCase):
     def test_update_period_name(self):
         """Test updating period name."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Old Name',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -344,7 +360,7 @@ class TestUpdatePeriod(BudgetPeriodsTestCase):
     def test_update_period_dates(self):
         """Test updating period dates."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -363,10 +379,52 @@ class TestUpdatePeriod(BudgetPeriodsTestCase):
         self.assertEqual(data['start_date'], '2025-02-01')
         self.assertEqual(data['end_date'], '2025-02-28')
 
+    def test_update_period_inverted_dates_rejected(self):
+        """Test updating with an end_date before the start_date is rejected."""
+        period = BudgetPeriod.objects.create(
+            budget_account=self.budget_account,
+            name='Test Period',
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+            created_by=self.user,
+        )
+
+        self.put(
+            f'/api/budget-periods/{period.id}',
+            {
+                'start_date': '2025-02-01',
+                'end_date': '2025-01-15',
+            },
+            **self.auth_headers(),
+        )
+        self.assertStatus(422)
+
+    def test_update_period_partial_update_inverting_dates_rejected(self):
+        """Test a partial update that moves start_date past the stored end_date is rejected."""
+        period = BudgetPeriod.objects.create(
+            budget_account=self.budget_account,
+            name='Test Period',
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+            created_by=self.user,
+        )
+
+        data = self.put(
+            f'/api/budget-periods/{period.id}',
+            {
+                'start_date': '2025-02-01',
+            },
+            **self.auth_headers(),
+        )
+        self.assertStatus(400)
+        self.assertIn('end_date', data['detail'])
+        period.refresh_from_db()
+        self.assertEqual(period.start_date, date(2025, 1, 1))
+
     def test_update_period_change_account(self):
         """Test updating period to different budget account."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -386,7 +444,7 @@ class TestUpdatePeriod(BudgetPeriodsTestCase):
     def test_update_period_with_invalid_account(self):
         """Test updating period with non-existent budget account."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -416,7 +474,7 @@ class TestUpdatePeriod(BudgetPeriodsTestCase):
     def test_update_period_requires_auth(self):
         """Test updating period requires authentication."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -428,7 +486,7 @@ class TestUpdatePeriod(BudgetPeriodsTestCase):
     def test_viewer_cannot_update_period(self):
         """Test that a viewer cannot update a period."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -450,7 +508,7 @@ class TestDeletePeriod(BudgetPeriodsTestCase):
     def test_delete_period_success(self):
         """Test successful period deletion."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -471,7 +529,7 @@ class TestDeletePeriod(BudgetPeriodsTestCase):
     def test_delete_period_requires_auth(self):
         """Test deleting period requires authentication."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -483,7 +541,7 @@ class TestDeletePeriod(BudgetPeriodsTestCase):
     def test_viewer_cannot_delete_period(self):
         """Test that a viewer cannot delete a period."""
         period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Test Period',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -502,61 +560,62 @@ class TestDeletePeriod(BudgetPeriodsTestCase):
 class TestCopyPeriod(BudgetPeriodsTestCase):
     """Tests for copying budget periods."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for copy tests."""
-        super().setUp()
+        super().setUpTestData()
         # Create source period with categories, budgets, and planned transactions
-        self.source_period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+        cls.source_period = BudgetPeriod.objects.create(
+            budget_account=cls.budget_account,
             name='January 2025',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
             weeks=4,
-            created_by=self.user,
+            created_by=cls.user,
         )
 
         # Create categories
-        self.cat1 = Category.objects.create(
-            budget_period=self.source_period,
+        cls.cat1 = Category.objects.create(
+            budget_period=cls.source_period,
             name='Groceries',
-            created_by=self.user,
+            created_by=cls.user,
         )
-        self.cat2 = Category.objects.create(
-            budget_period=self.source_period,
+        cls.cat2 = Category.objects.create(
+            budget_period=cls.source_period,
             name='Rent',
-            created_by=self.user,
+            created_by=cls.user,
         )
 
         # Create budgets
         Budget.objects.create(
-            budget_period=self.source_period,
-            category=self.cat1,
+            budget_period=cls.source_period,
+            category=cls.cat1,
             currency='PLN',
             amount=1500,
         )
         Budget.objects.create(
-            budget_period=self.source_period,
-            category=self.cat2,
+            budget_period=cls.source_period,
+            category=cls.cat2,
             currency='PLN',
             amount=2000,
         )
 
         # Create planned transactions
         PlannedTransaction.objects.create(
-            budget_period=self.source_period,
+            budget_period=cls.source_period,
             name='Monthly Rent',
             amount=2000,
             currency='PLN',
-            category=self.cat2,
+            category=cls.cat2,
             planned_date=date(2025, 1, 5),
             status='pending',
         )
         PlannedTransaction.objects.create(
-            budget_period=self.source_period,
+            budget_period=cls.source_period,
             name='Weekly Groceries',
             amount=400,
             currency='PLN',
-            category=self.cat1,
+            category=cls.cat1,
             planned_date=date(2025, 1, 10),
             status='pending',
         )
@@ -580,7 +639,7 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
 
     def test_copy_period_creates_new_categories(self):
         """Test that copying creates new categories."""
-        self.post(
+        data = self.post(
             f'/api/budget-periods/{self.source_period.id}/copy',
             {
                 'name': 'February 2025',
@@ -590,15 +649,13 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
             **self.auth_headers(),
         )
 
-        new_period = BudgetPeriod.objects.get(name='February 2025')
-        self.assertEqual(new_period.categories.count(), 2)
-
-        category_names = {c.name for c in new_period.categories.all()}
-        self.assertEqual(category_names, {'Groceries', 'Rent'})
+        category_names = list(Category.objects.filter(budget_period_id=data['id']).values_list('name', flat=True))
+        self.assertEqual(len(category_names), 2)
+        self.assertEqual(set(category_names), {'Groceries', 'Rent'})
 
     def test_copy_period_creates_new_budgets(self):
         """Test that copying creates new budgets."""
-        self.post(
+        data = self.post(
             f'/api/budget-periods/{self.source_period.id}/copy',
             {
                 'name': 'February 2025',
@@ -608,12 +665,11 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
             **self.auth_headers(),
         )
 
-        new_period = BudgetPeriod.objects.get(name='February 2025')
-        self.assertEqual(new_period.budgets.count(), 2)
+        self.assertEqual(Budget.objects.filter(budget_period_id=data['id']).count(), 2)
 
     def test_copy_period_adjusts_planned_dates(self):
         """Test that copying adjusts planned transaction dates."""
-        self.post(
+        data = self.post(
             f'/api/budget-periods/{self.source_period.id}/copy',
             {
                 'name': 'February 2025',
@@ -623,12 +679,11 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
             **self.auth_headers(),
         )
 
-        new_period = BudgetPeriod.objects.get(name='February 2025')
-        planned = new_period.planned_transactions.filter(name='Monthly Rent').first()
-        self.assertEqual(planned.planned_date, date(2025, 2, 5))
-
-        planned = new_period.planned_transactions.filter(name='Weekly Groceries').first()
-        self.assertEqual(planned.planned_date, date(2025, 2, 10))
+        planned_dates = dict(
+            PlannedTransaction.objects.filter(budget_period_id=data['id']).values_list('name', 'planned_date')
+        )
+        self.assertEqual(planned_dates['Monthly Rent'], date(2025, 2, 5))
+        self.assertEqual(planned_dates['Weekly Groceries'], date(2025, 2, 10))
 
     def test_copy_period_sets_planned_status_to_pending(self):
         """Test that copied planned transactions have pending status."""
@@ -637,7 +692,7 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
         source_planned.status = 'done'
         source_planned.save()
 
-        self.post(
+        data = self.post(
             f'/api/budget-periods/{self.source_period.id}/copy',
             {
                 'name': 'February 2025',
@@ -647,13 +702,12 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
             **self.auth_headers(),
         )
 
-        new_period = BudgetPeriod.objects.get(name='February 2025')
-        for planned in new_period.planned_transactions.all():
-            self.assertEqual(planned.status, 'pending')
+        statuses = set(PlannedTransaction.objects.filter(budget_period_id=data['id']).values_list('status', flat=True))
+        self.assertEqual(statuses, {'pending'})
 
     def test_copy_period_creates_balances(self):
         """Test that copying creates period balances."""
-        self.post(
+        data = self.post(
             f'/api/budget-periods/{self.source_period.id}/copy',
             {
                 'name': 'February 2025',
@@ -663,9 +717,21 @@ class TestCopyPeriod(BudgetPeriodsTestCase):
             **self.auth_headers(),
         )
 
-        new_period = BudgetPeriod.objects.get(name='February 2025')
-        balances = PeriodBalance.objects.filter(budget_period=new_period)
-        self.assertEqual(balances.count(), 4)
+        self.assertEqual(PeriodBalance.objects.filter(budget_period_id=data['id']).count(), 4)
+
+    def test_copy_period_inverted_dates_rejected(self):
+        """Test copying into a period whose end_date is before its start_date is rejected."""
+        self.post(
+            f'/api/budget-periods/{self.source_period.id}/copy',
+            {
+                'name': 'February 2025',
+                'start_date': '2025-02-28',
+                'end_date': '2025-02-01',
+            },
+            **self.auth_headers(),
+        )
+        self.assertStatus(422)
+        self.assertFalse(BudgetPeriod.objects.filter(name='February 2025').exists())
 
     def test_copy_period_not_found(self):
         """Test copying a non-existent period."""
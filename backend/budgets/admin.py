@@ -13,4 +13,3 @@ class BudgetAdmin(admin.ModelAdmin):
     list_filter = ('currency', 'budget_period', 'created_at')
     search_fields = ('category__name', 'budget_period__name')
     readonly_fields = ('created_at', 'updated_at')
-    date_hierarchy = 'created_at'
@@ -0,0 +1,15 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('budgets', '0004_budget_budget_period_cat_idx'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='budget',
+            name='budget_period_cat_idx',
+        ),
+    ]
@@ -2,9 +2,9 @@
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, Optional
+from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class BudgetCreate(BaseModel):
@@ -44,12 +44,8 @@ class BudgetOut(BaseModel):
     category: CategoryOut
     currency: str
     amount: Decimal
-    created_by: Optional[Any] = None
-    updated_by: Optional[Any] = None
+    # BUDGET_OUT_FIELDS loads only the *_id columns, not the user rows
+    created_by: Optional[int] = Field(None, validation_alias='created_by_id')
+    updated_by: Optional[int] = Field(None, validation_alias='updated_by_id')
     created_at: datetime
     updated_at: Optional[datetime] = None
-
-    @field_serializer('created_by', 'updated_by')
-    def serialize_user(self, value: Any, _info) -> Optional[int]:
-        """Serialize User to int (user id)."""
-        return int(value.id) if value else None
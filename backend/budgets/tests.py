@@ -11,102 +11,96 @@ from budget_accounts.models import BudgetAccount
 from budget_periods.models import BudgetPeriod
 from budgets.models import Budget
 from categories.models import Category
-from common.tests.mixins import APIClientMixin, AuthMixin
+from common.tests.mixins import APIClientMixin, AuthMixin, OtherWorkspaceMixin
 from workspaces.models import WorkspaceMember
 
 User = get_user_model()
 
 
-class BudgetsAPITestCase(AuthMixin, APIClientMixin, TestCase):
+class BudgetsAPITestCase(OtherWorkspaceMixin, AuthMixin, APIClientMixin, TestCase):
     """Test cases for budgets API endpoints."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data for budgets API tests."""
-        super().setUp()
+        super().setUpTestData()
         # Create an additional budget account for testing
-        self.other_account = BudgetAccount.objects.create(
-            workspace=self.workspace,
+        cls.other_account = BudgetAccount.objects.create(
+            workspace=cls.workspace,
             name='Other Account',
             description='Another budget account',
             default_currency='USD',
             is_active=True,
             display_order=1,
-            created_by=self.user,
+            created_by=cls.user,
         )
 
-        # Create budget periods
-        self.period1 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
-            name='January 2025',
-            start_date=date(2025, 1, 1),
-            end_date=date(2025, 1, 31),
-            weeks=5,
-            created_by=self.user,
+        # Create budget periods and categories with one INSERT per model
+        cls.period1, cls.period2, cls.other_period = BudgetPeriod.objects.bulk_create(
+            [
+                BudgetPeriod(
+                    budget_account=cls.budget_account,
+                    name='January 2025',
+                    start_date=date(2025, 1, 1),
+                    end_date=date(2025, 1, 31),
+                    weeks=5,
+                    created_by=cls.user,
+                ),
+                BudgetPeriod(
+                    budget_account=cls.budget_account,
+                    name='February 2025',
+                    start_date=date(2025, 2, 1),
+                    end_date=date(2025, 2, 28),
+                    weeks=4,
+                    created_by=cls.user,
+                ),
+                BudgetPeriod(
+                    budget_account=cls.other_account,
+                    name='March 2025',
+                    start_date=date(2025, 3, 1),
+                    end_date=date(2025, 3, 31),
+                    weeks=5,
+                    created_by=cls.user,
+                ),
+            ]
         )
 
-        self.period2 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
-            name='February 2025',
-            start_date=date(2025, 2, 1),
-            end_date=date(2025, 2, 28),
-            weeks=4,
-            created_by=self.user,
-        )
-
-        self.other_period = BudgetPeriod.objects.create(
-            budget_account=self.other_account,
-            name='March 2025',
-            start_date=date(2025, 3, 1),
-            end_date=date(2025, 3, 31),
-            weeks=5,
-            created_by=self.user,
-        )
-
-        # Create categories
-        self.category1 = Category.objects.create(
-            budget_period=self.period1,
-            name='Groceries',
-            created_by=self.user,
-        )
-
-        self.category2 = Category.objects.create(
-            budget_period=self.period1,
-            name='Transport',
-            created_by=self.user,
-        )
-
-        self.category3 = Category.objects.create(
-            budget_period=self.period2,
-            name='Entertainment',
-            created_by=self.user,
+        cls.category1, cls.category2, cls.category3 = Category.objects.bulk_create(
+            [
+                Category(budget_period=cls.period1, name='Groceries', created_by=cls.user),
+                Category(budget_period=cls.period1, name='Transport', created_by=cls.user),
+                Category(budget_period=cls.period2, name='Entertainment', created_by=cls.user),
+            ]
         )
 
         # Create some test budgets
-        self.budget1 = Budget.objects.create(
-            budget_period=self.period1,
-            category=self.category1,
-            currency='PLN',
-            amount=Decimal('1500.00'),
-            created_by=self.user,
-            updated_by=self.user,
-        )
-
-        self.budget2 = Budget.objects.create(
-            budget_period=self.period1,
-            category=self.category2,
-            currency='PLN',
-            amount=Decimal('500.00'),
-            created_by=self.user,
-            updated_by=self.user,
-        )
-
-        self.budget3 = Budget.objects.create(
-            budget_period=self.period2,
-            category=self.category3,
-            currency='EUR',
-            amount=Decimal('200.00'),
-            created_by=self.user,
-            updated_by=self.user,
+        cls.budget1, cls.budget2, cls.budget3 = Budget.objects.bulk_create(
+            [
+                Budget(
+                    budget_period=cls.period1,
+                    category=cls.category1,
+                    currency='PLN',
+                    amount=Decimal('1500.00'),
+                    created_by=cls.user,
+                    updated_by=cls.user,
+                ),
+                Budget(
+                    budget_period=cls.period1,
+                    category=cls.category2,
+                    currency='PLN',
+                    amount=Decimal('500.00'),
+                    created_by=cls.user,
+                    updated_by=cls.user,
+                ),
+                Budget(
+                    budget_period=cls.period2,
+                    category=cls.category3,
+                    currency='EUR',
+                    amount=Decimal('200.00'),
+                    created_by=cls.user,
+                    updated_by=cls.user,
+                ),
+            ]
         )
 
     # =============================================================================
@@ -117,7 +111,7 @@ class BudgetsAPITestCase(AuthMixin, APIClientMixin, TestCase):
         """Test listing all budgets in the workspace."""
         data = self.get('/api/budgets', **self.auth_headers())
         self.assertStatus(200)
-        self.assertEqual(len(data), 3)  # All 3 budgets created in setUp
+        self.assertEqual(len(data), 3)  # All 3 budgets created in setUpTestData
 
     def test_list_budgets_filtered_by_period(self):
         """Test listing budgets filtered by budget period."""
@@ -135,6 +129,13 @@ class BudgetsAPITestCase(AuthMixin, APIClientMixin, TestCase):
         self.assertStatus(200)
         self.assertEqual(len(data), 0)
 
+    def test_list_budgets_returns_user_ids(self):
+        """Test that created_by and updated_by are serialized as user ids."""
+        data = self.get('/api/budgets?budget_period_id=' + str(self.period2.id), **self.auth_headers())
+        self.assertStatus(200)
+        self.assertEqual(data[0]['created_by'], self.user.id)
+        self.assertEqual(data[0]['updated_by'], self.user.id)
+
     def test_list_budgets_without_auth_returns_401(self):
         """Test that listing budgets without authentication fails."""
         data = self.get('/api/budgets')
@@ -199,38 +200,7 @@ class BudgetsAPITestCase(AuthMixin, APIClientMixin, TestCase):
 
     def test_create_budget_with_period_from_other_workspace_fails(self):
         """Test that creating a budget with a period from another workspace fails."""
-        # Create another workspace with a period
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
+        _, other_user, _, other_period = self.create_other_workspace()
 
         other_category = Category.objects.create(
             budget_period=other_period,
@@ -314,6 +284,16 @@ class BudgetsAPITestCase(AuthMixin, APIClientMixin, TestCase):
         self.assertEqual(data['currency'], self.budget1.currency)
         self.assertEqual(data['category']['id'], self.budget1.category_id)
 
+    def test_update_budget_unchanged_amount_skips_write(self):
+        """Test that a PUT with the current amount does not touch the row."""
+        original_updated_at = self.budget1.updated_at
+        data = self.put(f'/api/budgets/{self.budget1.id}', {'amount': '1500.00'}, **self.auth_headers())
+        self.assertStatus(200)
+        self.assertEqual(data['amount'], '1500.00')
+
+        self.budget1.refresh_from_db()
+        self.assertEqual(self.budget1.updated_at, original_updated_at)
+
     def test_update_budget_not_found(self):
         """Test updating a budget that doesn't exist."""
         payload = {'amount': '500.00'}
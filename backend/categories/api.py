@@ -1,18 +1,19 @@
 """Django-Ninja API endpoints for categories app."""
 
-import json
 from datetime import date
 from typing import List
 
-from django.db import IntegrityError
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Subquery
 from ninja import File, Form, Query, Router
 from ninja.errors import HttpError
 from ninja.files import UploadedFile
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 from budget_periods.models import BudgetPeriod
 from categories.models import Category
-from categories.schemas import CategoryCreate, CategoryOut, CategoryUpdate
+from categories.schemas import CategoryCreate, CategoryImportList, CategoryOut, CategoryUpdate
 from common.auth import JWTAuth
 from common.permissions import require_role
 from common.throttle import validate_file_size
@@ -21,34 +22,28 @@ from workspaces.models import WRITE_ROLES
 
 router = Router(tags=['Categories'])
 
+# Columns needed to build a CategoryOut response; updated_at is kept so update_category's save() refreshes it
+CATEGORY_FIELDS = ('id', 'budget_period', 'name', 'created_by', 'updated_by', 'created_at', 'updated_at')
+
 
 # =============================================================================
 # Helper Functions
 # =============================================================================
 
 
-def get_workspace_period(period_id: int, workspace_id: int) -> BudgetPeriod:
+def get_workspace_period(period_id: int, workspace_id: int) -> BudgetPeriod | None:
     """Helper to get a period and verify it belongs to the current workspace."""
-    period = (
-        BudgetPeriod.objects.select_related('budget_account')
-        .filter(id=period_id, budget_account__workspace_id=workspace_id)
-        .first()
-    )
-    if not period:
-        return None
-    return period
+    # Callers only check that the period exists, so only its id is loaded
+    return BudgetPeriod.objects.only('id').filter(id=period_id, budget_account__workspace_id=workspace_id).first()
 
 
-def get_workspace_category(category_id: int, workspace_id: int) -> Category:
+def get_workspace_category(category_id: int, workspace_id: int) -> Category | None:
     """Helper to get a category and verify it belongs to the current workspace."""
-    category = (
-        Category.objects.select_related('budget_period__budget_account')
+    return (
+        Category.objects.only(*CATEGORY_FIELDS)
         .filter(id=category_id, budget_period__budget_account__workspace_id=workspace_id)
         .first()
     )
-    if not category:
-        return None
-    return category
 
 
 # =============================================================================
@@ -63,31 +58,33 @@ def list_categories(
     current_date: date | None = Query(None),
 ):
     """List categories for the current workspace."""
-    workspace = request.auth.current_workspace
+    workspace_id = request.auth.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
     if current_date:
-        period = (
-            BudgetPeriod.objects.select_related('budget_account')
-            .filter(budget_account__workspace_id=workspace.id, start_date__lte=current_date, end_date__gte=current_date)
-            .first()
+        # Resolve the period inside the category query; no matching period simply yields no categories
+        current_period = (
+            BudgetPeriod.objects.filter(budget_account__workspace_id=workspace_id, date_range__contains=current_date)
+            .order_by('pk')
+            .values('id')[:1]
         )
-        if period:
-            budget_period_id = period.id
-        else:
-            return []
+        return Category.objects.only(*CATEGORY_FIELDS).filter(budget_period_id=Subquery(current_period))
 
     if budget_period_id is None:
         raise HttpError(400, 'Either budget_period_id or current_date must be provided')
 
-    # Verify the period belongs to current workspace
-    period = get_workspace_period(budget_period_id, workspace.id)
-    if not period:
+    # Scope the list to the workspace directly; only an empty result needs the separate 404 check
+    categories = list(
+        Category.objects.only(*CATEGORY_FIELDS).filter(
+            budget_period_id=budget_period_id, budget_period__budget_account__workspace_id=workspace_id
+        )
+    )
+    if not categories and not get_workspace_period(budget_period_id, workspace_id):
         raise HttpError(404, 'Budget period not found')
 
-    return Category.objects.filter(budget_period_id=budget_period_id)
+    return categories
 
 
 # =============================================================================
@@ -108,20 +105,18 @@ def export_categories(
     budget_period_id: int = Query(...),
 ):
     """Export categories from a budget period as JSON."""
-    workspace = request.auth.current_workspace
+    workspace_id = request.auth.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
     # Verify the budget period belongs to current workspace
-    period = get_workspace_period(budget_period_id, workspace.id)
+    period = get_workspace_period(budget_period_id, workspace_id)
     if not period:
         raise HttpError(404, 'Budget period not found')
 
-    categories = Category.objects.filter(budget_period_id=budget_period_id)
-    category_names = [category.name for category in categories]
-
-    return category_names
+    # Names come straight off the cursor as strings, without building Category instances
+    return list(Category.objects.filter(budget_period_id=budget_period_id).values_list('name', flat=True))
 
 
 @router.post('/import', response={201: dict, 400: dict, 404: dict}, auth=JWTAuth())
@@ -132,44 +127,52 @@ def import_categories(
 ):
     """Import categories from a JSON file into a budget period."""
     user = request.auth
-    workspace = user.current_workspace
+    workspace_id = user.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
-    require_role(user, workspace.id, WRITE_ROLES)
+    require_role(user, workspace_id, WRITE_ROLES)
     # Validate file size (max 5MB)
     validate_file_size(file, max_size_mb=5)
 
     # Verify the budget period belongs to current workspace
-    period = get_workspace_period(budget_period_id, workspace.id)
+    period = get_workspace_period(budget_period_id, workspace_id)
     if not period:
         return 404, {'detail': 'Budget period not found'}
 
-    # Read file contents - Django Ninja's UploadedFile has .read() method directly
+    # Parse and type-check the upload in one pass - Django Ninja's UploadedFile has .read() method directly
     try:
-        contents = file.read()
-        data = json.loads(contents)
-        if not isinstance(data, list) or not all(isinstance(item, str) for item in data):
-            return 400, {'detail': 'Invalid JSON format. Expected a list of strings.'}
-    except json.JSONDecodeError:
-        return 400, {'detail': 'Invalid JSON file.'}
-
-    # Get existing category names for the budget period to avoid duplicates
+        data = CategoryImportList.model_validate_json(file.read()).root
+    except ValidationError as e:
+        if any(error['type'] == 'json_invalid' for error in e.errors()):
+            return 400, {'detail': 'Invalid JSON file.'}
+        return 400, {'detail': 'Invalid JSON format. Expected a list of strings.'}
+
+    # Drop duplicates within the file (keeping order), then look up only those names instead of the whole period
+    category_names = list(dict.fromkeys(data))
     existing_category_names = set(
-        Category.objects.filter(budget_period_id=budget_period_id).values_list('name', flat=True)
+        Category.objects.filter(budget_period_id=budget_period_id, name__in=category_names).values_list(
+            'name', flat=True
+        )
     )
 
-    new_categories_to_add = []
-    for category_name in data:
-        if category_name not in existing_category_names:
-            new_categories_to_add.append(Category(name=category_name, budget_period_id=budget_period_id))
-            existing_category_names.add(category_name)
+    new_categories_to_add = [
+        Category(name=category_name, budget_period_id=budget_period_id, created_by=user, updated_by=user)
+        for category_name in category_names
+        if category_name not in existing_category_names
+    ]
 
     if not new_categories_to_add:
         return 201, {'message': 'No new categories to import.'}
 
-    Category.objects.bulk_create(new_categories_to_add)
+    # The unique constraint still guards against a concurrent import between the check and the insert; all
+    # batches go in one transaction so the reported count is exactly what was written
+    try:
+        with transaction.atomic():
+            Category.objects.bulk_create(new_categories_to_add, batch_size=settings.BULK_CREATE_BATCH_SIZE)
+    except IntegrityError:
+        return 400, {'detail': 'Some of these categories were added while importing. Please retry the import.'}
 
     return 201, {'message': f'Successfully imported {len(new_categories_to_add)} new categories.'}
 
@@ -182,12 +185,12 @@ def import_categories(
 @router.get('/{category_id}', response={200: CategoryOut, 404: DetailOut}, auth=JWTAuth())
 def get_category(request, category_id: int):
     """Get a specific category by ID."""
-    workspace = request.auth.current_workspace
+    workspace_id = request.auth.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
-    category = get_workspace_category(category_id, workspace.id)
+    category = get_workspace_category(category_id, workspace_id)
     if not category:
         return 404, {'detail': 'Category not found'}
 
@@ -198,18 +201,28 @@ def get_category(request, category_id: int):
 def create_category(request, data: CategoryCreate):
     """Create a new category."""
     user = request.auth
-    workspace = user.current_workspace
+    workspace_id = user.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
-    require_role(user, workspace.id, WRITE_ROLES)
+    require_role(user, workspace_id, WRITE_ROLES)
 
-    # Verify the budget period belongs to current workspace
-    period = get_workspace_period(data.budget_period_id, workspace.id)
+    # Verify the budget period belongs to current workspace and check for a duplicate name in the same query
+    same_name = Category.objects.filter(budget_period_id=OuterRef('pk'), name=data.name)
+    period = (
+        BudgetPeriod.objects.only('id')
+        .annotate(name_taken=Exists(same_name))
+        .filter(id=data.budget_period_id, budget_account__workspace_id=workspace_id)
+        .first()
+    )
     if not period:
         return 404, {'detail': 'Budget period not found'}
 
+    if period.name_taken:
+        return 400, {'detail': 'A category with this name already exists in this budget period.'}
+
+    # The unique constraint still guards against a concurrent create between the check and the insert
     try:
         category = Category.objects.create(
             budget_period_id=data.budget_period_id,
@@ -227,14 +240,14 @@ def create_category(request, data: CategoryCreate):
 def update_category(request, category_id: int, data: CategoryUpdate):
     """Update a category."""
     user = request.auth
-    workspace = user.current_workspace
+    workspace_id = user.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
-    require_role(user, workspace.id, WRITE_ROLES)
+    require_role(user, workspace_id, WRITE_ROLES)
 
-    category = get_workspace_category(category_id, workspace.id)
+    category = get_workspace_category(category_id, workspace_id)
     if not category:
         return 404, {'detail': 'Category not found'}
 
@@ -251,14 +264,14 @@ def update_category(request, category_id: int, data: CategoryUpdate):
 def delete_category(request, category_id: int):
     """Delete a category."""
     user = request.auth
-    workspace = user.current_workspace
+    workspace_id = user.current_workspace_id
 
-    if not workspace:
+    if not workspace_id:
         raise HttpError(404, 'No workspace selected')
 
-    require_role(user, workspace.id, WRITE_ROLES)
+    require_role(user, workspace_id, WRITE_ROLES)
 
-    category = get_workspace_category(category_id, workspace.id)
+    category = get_workspace_category(category_id, workspace_id)
     if not category:
         return 404, {'detail': 'Category not found'}
 
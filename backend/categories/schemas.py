@@ -1,9 +1,9 @@
 """Pydantic schemas for categories API."""
 
 from datetime import datetime
-from typing import Any, Optional
+from typing import Optional
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, RootModel
 
 
 class CategoryCreate(BaseModel):
@@ -19,29 +19,19 @@ class CategoryUpdate(BaseModel):
     name: Optional[str] = Field(None, max_length=100)
 
 
+class CategoryImportList(RootModel[list[str]]):
+    """Schema for an uploaded category import file: a JSON list of names."""
+
+
 class CategoryOut(BaseModel):
     """Schema for category response."""
 
-    model_config = ConfigDict(
-        from_attributes=True,
-        arbitrary_types_allowed=True,
-    )
+    model_config = ConfigDict(from_attributes=True)
 
     id: int
     budget_period_id: int
     name: str
-    created_by: Optional[Any] = None
-    updated_by: Optional[Any] = None
+    # Taken from the *_id columns, so listing categories never loads their users
+    created_by: Optional[int] = Field(None, validation_alias='created_by_id')
+    updated_by: Optional[int] = Field(None, validation_alias='updated_by_id')
     created_at: datetime
-
-    @field_validator('created_by', 'updated_by', mode='before')
-    @classmethod
-    def validate_user_id(cls, value: Any) -> Optional[int]:
-        """Extract user ID from Django User ForeignKey field."""
-        if value is None:
-            return None
-        if hasattr(value, 'id'):
-            return value.id
-        if isinstance(value, int):
-            return value
-        return None
@@ -2,6 +2,7 @@
 
 import json
 from datetime import date
+from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.core.files.uploadedfile import SimpleUploadedFile
@@ -10,7 +11,7 @@ from django.test import TestCase
 from budget_accounts.models import BudgetAccount
 from budget_periods.models import BudgetPeriod
 from categories.models import Category
-from common.tests.mixins import APIClientMixin, AuthMixin
+from common.tests.mixins import APIClientMixin, AuthMixin, OtherWorkspaceMixin
 from workspaces.models import WorkspaceMember
 
 User = get_user_model()
@@ -21,68 +22,68 @@ User = get_user_model()
 # =============================================================================
 
 
-class CategoriesTestCase(AuthMixin, APIClientMixin, TestCase):
+class CategoriesTestCase(OtherWorkspaceMixin, AuthMixin, APIClientMixin, TestCase):
     """Base test case for categories tests with common setup."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up authenticated user and create test data."""
-        super().setUp()
+        super().setUpTestData()
         # Create an additional budget account for testing
-        self.other_account = BudgetAccount.objects.create(
-            workspace=self.workspace,
+        cls.other_account = BudgetAccount.objects.create(
+            workspace=cls.workspace,
             name='Other Account',
             description='Another budget account',
             default_currency='USD',
             is_active=True,
             display_order=1,
-            created_by=self.user,
-        )
-
-        # Create budget periods
-        self.period1 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
-            name='January 2025',
-            start_date=date(2025, 1, 1),
-            end_date=date(2025, 1, 31),
-            weeks=5,
-            created_by=self.user,
-        )
-
-        self.period2 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
-            name='February 2025',
-            start_date=date(2025, 2, 1),
-            end_date=date(2025, 2, 28),
-            weeks=4,
-            created_by=self.user,
-        )
-
-        self.other_period = BudgetPeriod.objects.create(
-            budget_account=self.other_account,
-            name='March 2025',
-            start_date=date(2025, 3, 1),
-            end_date=date(2025, 3, 31),
-            weeks=5,
-            created_by=self.user,
-        )
-
-        # Create categories
-        self.category1 = Category.objects.create(
-            budget_period=self.period1,
-            name='Groceries',
-            created_by=self.user,
-        )
-
-        self.category2 = Category.objects.create(
-            budget_period=self.period1,
-            name='Transport',
-            created_by=self.user,
-        )
-
-        self.category3 = Category.objects.create(
-            budget_period=self.period2,
-            name='Entertainment',
-            created_by=self.user,
+            created_by=cls.user,
+        )
+
+        # Create budget periods and categories with one INSERT per model
+        cls.period1, cls.period2, cls.other_period = BudgetPeriod.objects.bulk_create(
+            [
+                BudgetPeriod(
+                    budget_account=cls.budget_account,
+                    name='January 2025',
+                    start_date=date(2025, 1, 1),
+                    end_date=date(2025, 1, 31),
+                    weeks=5,
+                    created_by=cls.user,
+                ),
+                BudgetPeriod(
+                    budget_account=cls.budget_account,
+                    name='February 2025',
+                    start_date=date(2025, 2, 1),
+                    end_date=date(2025, 2, 28),
+                    weeks=4,
+                    created_by=cls.user,
+                ),
+                BudgetPeriod(
+                    budget_account=cls.other_account,
+                    name='March 2025',
+                    start_date=date(2025, 3, 1),
+                    end_date=date(2025, 3, 31),
+                    weeks=5,
+                    created_by=cls.user,
+                ),
+            ]
+        )
+
+        cls.category1, cls.category2, cls.category3 = Category.objects.bulk_create(
+            [
+                Category(budget_period=cls.period1, name='Groceries', created_by=cls.user),
+                Category(budget_period=cls.period1, name='Transport', created_by=cls.user),
+                Category(budget_period=cls.period2, name='Entertainment', created_by=cls.user),
+            ]
+        )
+
+        # Another workspace's data, used by the cross-workspace access tests
+        cls.foreign_workspace, cls.foreign_user, _, cls.foreign_period = cls.create_other_workspace()
+        cls.foreign_category = Category.objects.create(
+            budget_period=cls.foreign_period,
+            name='Other Category',
+            created_by=cls.foreign_user,
         )
 
 
@@ -96,7 +97,9 @@ class TestListCategories(CategoriesTestCase):
 
     def test_list_categories_with_period_id(self):
         """Test listing categories filtered by budget period."""
-        data = self.get(f'/api/categories?budget_period_id={self.period1.id}', **self.auth_headers())
+        # Auth lookup + one workspace-scoped category query
+        with self.assertNumQueries(2):
+            data = self.get(f'/api/categories?budget_period_id={self.period1.id}', **self.auth_headers())
         self.assertStatus(200)
         self.assertEqual(len(data), 2)
         category_names = {c['name'] for c in data}
@@ -123,47 +126,8 @@ class TestListCategories(CategoriesTestCase):
 
     def test_list_categories_from_other_workspace_fails(self):
         """Test that listing categories from another workspace fails."""
-        # Create another workspace with period and category
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
-        Category.objects.create(
-            budget_period=other_period,
-            name='Other Category',
-            created_by=other_user,
-        )
-
         # Try to access with current user
-        data = self.get(f'/api/categories?budget_period_id={other_period.id}', **self.auth_headers())
+        data = self.get(f'/api/categories?budget_period_id={self.foreign_period.id}', **self.auth_headers())
         self.assertStatus(404)
 
     def test_list_categories_without_auth_fails(self):
@@ -182,10 +146,14 @@ class TestGetCategory(CategoriesTestCase):
 
     def test_get_category_by_id(self):
         """Test getting a category by ID."""
-        data = self.get(f'/api/categories/{self.category1.id}', **self.auth_headers())
+        # Auth lookup + category lookup; user references come from the FK columns
+        with self.assertNumQueries(2):
+            data = self.get(f'/api/categories/{self.category1.id}', **self.auth_headers())
         self.assertStatus(200)
         self.assertEqual(data['id'], self.category1.id)
         self.assertEqual(data['name'], 'Groceries')
+        self.assertEqual(data['created_by'], self.user.id)
+        self.assertIsNone(data['updated_by'])
 
     def test_get_category_not_found(self):
         """Test getting a non-existent category."""
@@ -194,45 +162,7 @@ class TestGetCategory(CategoriesTestCase):
 
     def test_get_category_from_other_workspace_fails(self):
         """Test that getting a category from another workspace fails."""
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
-        other_category = Category.objects.create(
-            budget_period=other_period,
-            name='Other Category',
-            created_by=other_user,
-        )
-
-        data = self.get(f'/api/categories/{other_category.id}', **self.auth_headers())
+        data = self.get(f'/api/categories/{self.foreign_category.id}', **self.auth_headers())
         self.assertStatus(404)
 
     def test_get_category_requires_auth(self):
@@ -291,41 +221,9 @@ class TestCreateCategory(CategoriesTestCase):
 
     def test_create_category_with_period_from_other_workspace_fails(self):
         """Test that creating a category with a period from another workspace fails."""
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
         payload = {
             'name': 'Some Category',
-            'budget_period_id': other_period.id,
+            'budget_period_id': self.foreign_period.id,
         }
         data = self.post('/api/categories', payload, **self.auth_headers())
         self.assertStatus(404)
@@ -341,7 +239,7 @@ class TestCreateCategory(CategoriesTestCase):
 
     def test_viewer_cannot_create_category(self):
         """Test that a viewer cannot create a category."""
-        WorkspaceMember.objects.filter(user=self.user).update(role='viewer')
+        WorkspaceMember.objects.filter(pk=self.member.pk).update(role='viewer')
         payload = {
             'name': 'Healthcare',
             'budget_period_id': self.period1.id,
@@ -351,7 +249,7 @@ class TestCreateCategory(CategoriesTestCase):
 
     def test_member_can_create_category(self):
         """Test that a member can create a category."""
-        WorkspaceMember.objects.filter(user=self.user).update(role='member')
+        WorkspaceMember.objects.filter(pk=self.member.pk).update(role='member')
         payload = {
             'name': 'Healthcare',
             'budget_period_id': self.period1.id,
@@ -389,46 +287,8 @@ class TestUpdateCategory(CategoriesTestCase):
 
     def test_update_category_from_other_workspace_fails(self):
         """Test that updating a category from another workspace fails."""
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
-        other_category = Category.objects.create(
-            budget_period=other_period,
-            name='Other Category',
-            created_by=other_user,
-        )
-
         payload = {'name': 'Changed Name'}
-        data = self.put(f'/api/categories/{other_category.id}', payload, **self.auth_headers())
+        data = self.put(f'/api/categories/{self.foreign_category.id}', payload, **self.auth_headers())
         self.assertStatus(404)
 
     def test_update_category_without_auth_fails(self):
@@ -439,7 +299,7 @@ class TestUpdateCategory(CategoriesTestCase):
 
     def test_viewer_cannot_update_category(self):
         """Test that a viewer cannot update a category."""
-        WorkspaceMember.objects.filter(user=self.user).update(role='viewer')
+        WorkspaceMember.objects.filter(pk=self.member.pk).update(role='viewer')
         payload = {'name': 'New Name'}
         data = self.put(f'/api/categories/{self.category1.id}', payload, **self.auth_headers())
         self.assertStatus(403)
@@ -469,45 +329,7 @@ class TestDeleteCategory(CategoriesTestCase):
 
     def test_delete_category_from_other_workspace_fails(self):
         """Test that deleting a category from another workspace fails."""
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
-        other_category = Category.objects.create(
-            budget_period=other_period,
-            name='Other Category',
-            created_by=other_user,
-        )
-
-        self.delete(f'/api/categories/{other_category.id}', **self.auth_headers())
+        self.delete(f'/api/categories/{self.foreign_category.id}', **self.auth_headers())
         self.assertStatus(404)
 
     def test_delete_category_without_auth_fails(self):
@@ -517,7 +339,7 @@ class TestDeleteCategory(CategoriesTestCase):
 
     def test_viewer_cannot_delete_category(self):
         """Test that a viewer cannot delete a category."""
-        WorkspaceMember.objects.filter(user=self.user).update(role='viewer')
+        WorkspaceMember.objects.filter(pk=self.member.pk).update(role='viewer')
         self.delete(f'/api/categories/{self.category1.id}', **self.auth_headers())
         self.assertStatus(403)
 
@@ -532,7 +354,9 @@ class TestExportCategories(CategoriesTestCase):
 
     def test_export_categories_success(self):
         """Test exporting categories from a budget period."""
-        data = self.get(f'/api/categories/export/?budget_period_id={self.period1.id}', **self.auth_headers())
+        # Auth lookup + period check + category names
+        with self.assertNumQueries(3):
+            data = self.get(f'/api/categories/export/?budget_period_id={self.period1.id}', **self.auth_headers())
         self.assertStatus(200)
         self.assertEqual(len(data), 2)
         self.assertIn('Groceries', data)
@@ -541,7 +365,7 @@ class TestExportCategories(CategoriesTestCase):
     def test_export_categories_empty_period(self):
         """Test exporting categories from a period with no categories."""
         empty_period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='Empty Period',
             start_date=date(2025, 5, 1),
             end_date=date(2025, 5, 31),
@@ -554,45 +378,7 @@ class TestExportCategories(CategoriesTestCase):
 
     def test_export_categories_from_other_workspace_fails(self):
         """Test that exporting categories from another workspace fails."""
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
-        Category.objects.create(
-            budget_period=other_period,
-            name='Other Category',
-            created_by=other_user,
-        )
-
-        data = self.get(f'/api/categories/export/?budget_period_id={other_period.id}', **self.auth_headers())
+        data = self.get(f'/api/categories/export/?budget_period_id={self.foreign_period.id}', **self.auth_headers())
         self.assertStatus(404)
 
     def test_export_categories_without_auth_fails(self):
@@ -722,38 +508,6 @@ class TestImportCategories(CategoriesTestCase):
 
     def test_import_categories_from_other_workspace_fails(self):
         """Test that importing categories to another workspace's period fails."""
-        from workspaces.models import Workspace, WorkspaceMember
-
-        other_workspace = Workspace.objects.create(name='Other Workspace')
-        other_user = User.objects.create_user(
-            email='other@example.com',
-            password='otherpass123',
-            current_workspace=other_workspace,
-        )
-        other_workspace.owner = other_user
-        other_workspace.save()
-
-        WorkspaceMember.objects.create(
-            workspace=other_workspace,
-            user=other_user,
-            role='owner',
-        )
-
-        other_account = BudgetAccount.objects.create(
-            workspace=other_workspace,
-            name='Other Account',
-            default_currency='PLN',
-            created_by=other_user,
-        )
-
-        other_period = BudgetPeriod.objects.create(
-            budget_account=other_account,
-            name='Other Period',
-            start_date=date(2025, 4, 1),
-            end_date=date(2025, 4, 30),
-            created_by=other_user,
-        )
-
         categories_data = json.dumps(['New Category'])
         file = SimpleUploadedFile(
             'categories.json',
@@ -763,7 +517,7 @@ class TestImportCategories(CategoriesTestCase):
 
         data = self.post_file(
             '/api/categories/import',
-            {'file': file, 'budget_period_id': other_period.id},
+            {'file': file, 'budget_period_id': self.foreign_period.id},
             **self.auth_headers(),
         )
         self.assertStatus(404)
@@ -785,7 +539,7 @@ class TestImportCategories(CategoriesTestCase):
 
     def test_viewer_cannot_import_categories(self):
         """Test that a viewer cannot import categories."""
-        WorkspaceMember.objects.filter(user=self.user).update(role='viewer')
+        WorkspaceMember.objects.filter(pk=self.member.pk).update(role='viewer')
         categories_data = json.dumps(['New Category'])
         file = SimpleUploadedFile(
             'categories.json',
@@ -800,6 +554,34 @@ class TestImportCategories(CategoriesTestCase):
         )
         self.assertStatus(403)
 
+    def test_import_categories_conflict_during_insert(self):
+        """Test a name added between the duplicate check and the insert rolls the import back."""
+        categories_data = json.dumps(['Dining Out', 'Healthcare'])
+        file = SimpleUploadedFile(
+            'categories.json',
+            categories_data.encode('utf-8'),
+            content_type='application/json',
+        )
+        real_bulk_create = Category.objects.bulk_create
+
+        def bulk_create_after_concurrent_import(objs, **kwargs):
+            # Simulate another request committing one of the names after the pre-check ran
+            Category.objects.create(budget_period=self.period2, name='Healthcare', created_by=self.user)
+            return real_bulk_create(objs, **kwargs)
+
+        with patch.object(Category.objects, 'bulk_create', side_effect=bulk_create_after_concurrent_import):
+            data = self.post_file(
+                '/api/categories/import',
+                {'file': file, 'budget_period_id': self.period2.id},
+                **self.auth_headers(),
+            )
+        self.assertStatus(400)
+        self.assertIn('retry', data['detail'])
+
+        # Nothing from the failed import was written, only the concurrent row remains
+        self.assertFalse(Category.objects.filter(budget_period=self.period2, name='Dining Out').exists())
+        self.assertEqual(Category.objects.filter(budget_period=self.period2, name='Healthcare').count(), 1)
+
     def test_import_categories_duplicates_within_file(self):
         """Test that importing handles duplicates within the file itself."""
         categories_data = json.dumps(['New1', 'New2', 'New1', 'New2'])
@@ -14,22 +14,39 @@ from workspaces.models import ROLE_HIERARCHY, Role
 User = get_user_model()
 
 
+def user_id_from_token(token: str) -> Optional[str]:
+    """Decode a bearer token and return its user_id claim, or None if the token is not usable."""
+    payload = decode_access_token(token)
+    if payload is None:
+        return None
+    return payload.get('user_id')
+
+
+def authenticatable_users():
+    """Users a valid token may resolve to, with the workspace every endpoint reads preloaded."""
+    return User.objects.select_related('current_workspace').filter(is_active=True)
+
+
 class JWTAuth(HttpBearer):
     """JWT authentication for Django-Ninja."""
 
     def authenticate(self, request, token: str) -> Optional[User]:
         """Authenticate request using JWT token."""
-        try:
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
-            user_id = payload.get('user_id')
-            if user_id is None:
-                return None
-            user = User.objects.get(id=user_id)
-            if not user.is_active:
-                return None
-            return user
-        except (jwt.PyJWTError, User.DoesNotExist):
+        user_id = user_id_from_token(token)
+        if user_id is None:
+            return None
+        return authenticatable_users().filter(id=user_id).first()
+
+
+class AsyncJWTAuth(HttpBearer):
+    """JWT authentication for async Django-Ninja endpoints."""
+
+    async def authenticate(self, request, token: str) -> Optional[User]:
+        """Authenticate request using JWT token without blocking the event loop."""
+        user_id = user_id_from_token(token)
+        if user_id is None:
             return None
+        return await authenticatable_users().filter(id=user_id).afirst()
 
 
 def create_access_token(user: User) -> str:
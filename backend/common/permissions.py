@@ -2,15 +2,38 @@
 
 from ninja.errors import HttpError
 
-from workspaces.models import Role, WorkspaceMember
+from workspaces.models import Role, Workspace, WorkspaceMember
+
+
+def get_current_workspace(user) -> Workspace:
+    """Return the user's current workspace, raising 404 if none is selected."""
+    workspace = user.current_workspace
+    if not workspace:
+        raise HttpError(404, 'No workspace selected')
+    return workspace
+
+
+def get_workspace_role(user, workspace_id: int) -> str:
+    """
+    Return the user's role in a workspace, defaulting to viewer.
+
+    The resolved role is memoized on the user instance. JWTAuth loads a fresh
+    user for every request, so the cache lives exactly as long as the request.
+    """
+    cache = user.__dict__.setdefault('_workspace_role_cache', {})
+    if workspace_id not in cache:
+        member = WorkspaceMember.objects.only('role').filter(workspace_id=workspace_id, user=user).first()
+        cache_workspace_role(user, workspace_id, member.role if member else None)
+    return cache[workspace_id]
+
+
+def cache_workspace_role(user, workspace_id: int, role: str | None) -> None:
+    """Record a role resolved elsewhere (e.g. via a query annotation) for later role checks."""
+    user.__dict__.setdefault('_workspace_role_cache', {})[workspace_id] = role or Role.VIEWER
 
 
 def require_role(user, workspace_id: int, allowed_roles: list[str]) -> None:
     """Raise 403 if user's role is not in allowed_roles."""
-    try:
-        member = WorkspaceMember.objects.get(workspace_id=workspace_id, user=user)
-        role = member.role
-    except WorkspaceMember.DoesNotExist:
-        role = Role.VIEWER
+    role = get_workspace_role(user, workspace_id)
     if role not in allowed_roles:
         raise HttpError(403, f'Insufficient permissions. Required: {", ".join(allowed_roles)}. Your role: {role}')
@@ -4,12 +4,13 @@ This module provides reusable mixins for API testing that can be used
 across all Django apps in the project.
 """
 
-import json
+from datetime import date
 
 from django.contrib.auth import get_user_model
 from django.test import Client
 
 from budget_accounts.models import BudgetAccount
+from budget_periods.models import BudgetPeriod
 from common.auth import create_access_token
 from workspaces.models import Workspace, WorkspaceMember
 
@@ -27,7 +28,7 @@ class APIClientMixin:
         """Helper for POST requests with JSON."""
         response = self.client.post(
             path,
-            data=json.dumps(data),
+            data=data,
             content_type='application/json',
             **kwargs,
         )
@@ -49,7 +50,7 @@ class APIClientMixin:
         """Helper for PATCH requests with JSON."""
         response = self.client.patch(
             path,
-            data=json.dumps(data) if data is not None else None,
+            data=data,
             content_type='application/json',
             **kwargs,
         )
@@ -60,7 +61,7 @@ class APIClientMixin:
         """Helper for PUT requests with JSON."""
         response = self.client.put(
             path,
-            data=json.dumps(data),
+            data=data,
             content_type='application/json',
             **kwargs,
         )
@@ -88,6 +89,8 @@ class AuthMixin:
         class MyTestCase(AuthMixin, APIClientMixin, TestCase):
             def test_something(self):
                 # self.user is available
+                # self.member (the user's owner membership) is available
+                # self.budget_account (the default 'General' account) is available
                 # self.auth_token is available
                 # self.get('/api/endpoint', **self.auth_headers())
     """
@@ -101,52 +104,59 @@ class AuthMixin:
     # Set to True to create demo fixtures (default: False for faster tests)
     with_demo_fixtures = False
 
-    def setUp(self):
-        """Set up authenticated user."""
+    @classmethod
+    def setUpTestData(cls):
+        """Create the authenticated user once per test class.
+
+        Django wraps each test in a transaction and deep-copies these class
+        attributes per test, so tests can still modify them freely.
+        """
+        super().setUpTestData()
+
         # Create workspace
-        self.workspace = Workspace.objects.create(name=self.workspace_name)
+        cls.workspace = Workspace.objects.create(name=cls.workspace_name)
 
         # Create user
-        self.user = User.objects.create_user(
-            email=self.user_email,
-            password=self.user_password,
-            full_name=self.user_full_name,
-            current_workspace=self.workspace,
+        cls.user = User.objects.create_user(
+            email=cls.user_email,
+            password=cls.user_password,
+            full_name=cls.user_full_name,
+            current_workspace=cls.workspace,
         )
 
         # Update workspace owner
-        self.workspace.owner = self.user
-        self.workspace.save()
+        cls.workspace.owner = cls.user
+        cls.workspace.save()
 
         # Create workspace membership with owner role
-        WorkspaceMember.objects.create(
-            workspace=self.workspace,
-            user=self.user,
+        cls.member = WorkspaceMember.objects.create(
+            workspace=cls.workspace,
+            user=cls.user,
             role='owner',
         )
 
         # Create default budget account
-        BudgetAccount.objects.create(
-            workspace=self.workspace,
+        cls.budget_account = BudgetAccount.objects.create(
+            workspace=cls.workspace,
             name='General',
             description='General budget account',
             default_currency='PLN',
             is_active=True,
             display_order=0,
-            created_by=self.user,
+            created_by=cls.user,
         )
 
         # Optionally create demo fixtures
-        if self.with_demo_fixtures:
+        if cls.with_demo_fixtures:
             from core.demo_fixtures import create_demo_fixtures
 
             create_demo_fixtures(
-                workspace_id=self.workspace.id,
-                user_id=self.user.id,
+                workspace_id=cls.workspace.id,
+                user_id=cls.user.id,
             )
 
         # Generate JWT token
-        self.auth_token = create_access_token(self.user)
+        cls.auth_token = create_access_token(cls.user)
 
     def auth_headers(self) -> dict:
         """Get auth headers for authenticated requests."""
@@ -159,3 +169,51 @@ class AuthMixin:
     def get_workspace(self) -> Workspace:
         """Get the user's workspace (alias for self.workspace)."""
         return self.workspace
+
+
+class OtherWorkspaceMixin:
+    """
+    Mixin that builds a second, unrelated workspace for cross-workspace access tests.
+
+    Example:
+        class MyTestCase(OtherWorkspaceMixin, AuthMixin, APIClientMixin, TestCase):
+            @classmethod
+            def setUpTestData(cls):
+                super().setUpTestData()
+                cls.other_workspace, _, _, cls.other_period = cls.create_other_workspace()
+    """
+
+    @classmethod
+    def create_other_workspace(cls) -> tuple[Workspace, User, BudgetAccount, BudgetPeriod]:
+        """Create a workspace owned by another user, with one budget account and period."""
+        workspace = Workspace.objects.create(name='Other Workspace')
+        user = User.objects.create_user(
+            email='other@example.com',
+            password='otherpass123',
+            current_workspace=workspace,
+        )
+        workspace.owner = user
+        workspace.save()
+
+        WorkspaceMember.objects.create(
+            workspace=workspace,
+            user=user,
+            role='owner',
+        )
+
+        account = BudgetAccount.objects.create(
+            workspace=workspace,
+            name='Other Account',
+            default_currency='PLN',
+            created_by=user,
+        )
+
+        period = BudgetPeriod.objects.create(
+            budget_account=account,
+            name='Other Period',
+            start_date=date(2025, 4, 1),
+            end_date=date(2025, 4, 30),
+            created_by=user,
+        )
+
+        return workspace, user, account, period
@@ -0,0 +1,49 @@
+"""Tests for shared permission utilities."""
+
+from django.test import TestCase
+from ninja.errors import HttpError
+
+from common.permissions import get_current_workspace, get_workspace_role, require_role
+from common.tests.mixins import AuthMixin
+from workspaces.models import ADMIN_ROLES, WRITE_ROLES, Role, Workspace
+
+
+class TestWorkspaceRole(AuthMixin, TestCase):
+    """Tests for get_workspace_role and require_role."""
+
+    def test_returns_member_role(self):
+        """Role should come from the user's workspace membership."""
+        self.assertEqual(get_workspace_role(self.user, self.workspace.id), Role.OWNER)
+
+    def test_defaults_to_viewer_without_membership(self):
+        """Users without a membership are treated as viewers."""
+        other_workspace = Workspace.objects.create(name='Other Workspace')
+        self.assertEqual(get_workspace_role(self.user, other_workspace.id), Role.VIEWER)
+
+    def test_role_is_cached_per_user_instance(self):
+        """Repeated role checks on the same user should hit the database once."""
+        with self.assertNumQueries(1):
+            require_role(self.user, self.workspace.id, WRITE_ROLES)
+            require_role(self.user, self.workspace.id, ADMIN_ROLES)
+
+    def test_raises_403_for_insufficient_role(self):
+        """require_role should raise 403 when the role is not allowed."""
+        other_workspace = Workspace.objects.create(name='Other Workspace')
+        with self.assertRaises(HttpError) as context:
+            require_role(self.user, other_workspace.id, WRITE_ROLES)
+        self.assertEqual(context.exception.status_code, 403)
+
+
+class TestCurrentWorkspace(AuthMixin, TestCase):
+    """Tests for get_current_workspace."""
+
+    def test_returns_current_workspace(self):
+        """The user's selected workspace should be returned."""
+        self.assertEqual(get_current_workspace(self.user), self.workspace)
+
+    def test_raises_404_without_workspace(self):
+        """Users without a selected workspace should get a 404."""
+        self.user.current_workspace = None
+        with self.assertRaises(HttpError) as context:
+            get_current_workspace(self.user)
+        self.assertEqual(context.exception.status_code, 404)
@@ -12,3 +12,9 @@ CACHES = {
         'LOCATION': 'test-cache',
     }
 }
+
+# Tests never rely on password strength, so skip PBKDF2's deliberately slow hashing
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# Test data is disposable, so don't wait for WAL flushes on commit (test DB setup, TransactionTestCase)
+DATABASES['default']['OPTIONS'] = {'options': '-c synchronous_commit=off'}  # noqa: F405
@@ -3,7 +3,7 @@
 from django.contrib.auth import get_user_model
 from django.test import override_settings
 
-from workspaces.models import Workspace
+from workspaces.models import Workspace, WorkspaceMember
 
 from .base import AuthTestCase
 
@@ -31,7 +31,6 @@ class TestAuthRegister(AuthTestCase):
     def test_register_creates_workspace(self):
         """Test that registration creates workspace, member, and budget account."""
         from budget_accounts.models import BudgetAccount
-        from workspaces.models import WorkspaceMember
 
         self.post(
             '/api/auth/register',
@@ -28,7 +28,6 @@ class CurrencyExchangeTestCase(APIClientMixin, AuthMixin, TestCase):
     def setUp(self):
         """Set up test data for currency exchange API tests."""
         APIClientMixin.setUp(self)
-        AuthMixin.setUp(self)
 
         # Get or create the general budget account
         self.account = BudgetAccount.objects.filter(workspace=self.workspace, name='General').first()
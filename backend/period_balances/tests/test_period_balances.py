@@ -38,7 +38,7 @@ class PeriodBalancesTestCase(AuthMixin, APIClientMixin, TestCase):
 
         # Create budget periods
         self.period1 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='January 2025',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -47,7 +47,7 @@ class PeriodBalancesTestCase(AuthMixin, APIClientMixin, TestCase):
         )
 
         self.period2 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='February 2025',
             start_date=date(2025, 2, 1),
             end_date=date(2025, 2, 28),
@@ -293,7 +293,7 @@ class PeriodBalancesTestCase(AuthMixin, APIClientMixin, TestCase):
         """Test recalculating creates balance if it doesn't exist."""
         # Create a new period with no balances
         new_period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='April 2025',
             start_date=date(2025, 4, 1),
             end_date=date(2025, 4, 30),
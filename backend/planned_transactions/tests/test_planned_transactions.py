@@ -30,7 +30,6 @@ class PlannedTransactionTestCase(APIClientMixin, AuthMixin, TestCase):
     def setUp(self):
         """Set up test data for planned transaction API tests."""
         APIClientMixin.setUp(self)
-        AuthMixin.setUp(self)
 
         # Get or create the general budget account
         self.account = BudgetAccount.objects.filter(workspace=self.workspace, name='General').first()
@@ -32,7 +32,7 @@ class TransactionsTestCase(AuthMixin, APIClientMixin, TestCase):
 
         # Create budget period
         self.period = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='January 2025',
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 31),
@@ -42,7 +42,7 @@ class TransactionsTestCase(AuthMixin, APIClientMixin, TestCase):
 
         # Create another period
         self.period2 = BudgetPeriod.objects.create(
-            budget_account=self.workspace.budget_accounts.first(),
+            budget_account=self.budget_account,
             name='February 2025',
             start_date=date(2025, 2, 1),
             end_date=date(2025, 2, 28),
@@ -21,7 +21,6 @@ class WorkspaceTestCase(APIClientMixin, AuthMixin, TestCase):
     def setUp(self):
         """Set up test data for workspace API tests."""
         APIClientMixin.setUp(self)
-        AuthMixin.setUp(self)
 
         # Create additional users for testing
         self.admin_user = User.objects.create_user(